@@ -12,6 +12,7 @@ Examples of artifacts:
 """
 
 import re
+from functools import lru_cache
 from typing import List
 
 
@@ -113,10 +114,14 @@ IGNORE_PATTERNS: List[str] = [
 # =============================================================================
 
 
+@lru_cache(maxsize=4096)
 def is_artifact(item_name: str) -> bool:
     """
     Check if item is an OCR/admin artifact that should be ignored.
     
+    Results are memoized per item name, since bills repeat the same
+    line text (gloves, syringes) and every call scans all patterns.
+    
     Args:
         item_name: Item name to check
         
@@ -5,10 +5,14 @@ Stores embeddings on disk (JSON format) to avoid redundant API calls.
 Key = SHA256 hash of normalized text
 Value = embedding vector as list of floats
 
+In memory the vectors live in one contiguous float32 matrix, so batches of
+cached embeddings are gathered with a single fancy-indexed copy.
+
 Usage:
     cache = EmbeddingCache()
     cache.get("some text")  # Returns embedding or None
     cache.set("some text", embedding_array)
+    cache.get_matrix(["a", "b"])  # Returns (embeddings matrix, missing indices)
     cache.save()  # Persist to disk
 """
 
@@ -20,12 +24,15 @@ import logging
 import os
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Rows allocated for the first embedding; the matrix doubles when full
+_INITIAL_CAPACITY = 256
+
 
 def _normalize_text(text: str) -> str:
     """Normalize text for consistent cache keys."""
@@ -64,8 +71,10 @@ class EmbeddingCache:
                 os.getenv("EMBEDDING_CACHE_PATH", str(default_path))
             )
         
-        # In-memory cache: hash -> embedding list
-        self._cache: Dict[str, List[float]] = {}
+        # In-memory cache: hash -> row of the (capacity, dimension) float32 matrix.
+        # Rows are assigned in insertion order and only ever reset all at once.
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
         
         # Thread safety
         self._lock = threading.RLock()
@@ -76,7 +85,7 @@ class EmbeddingCache:
         # Load existing cache from disk
         self._load()
         
-        logger.info(f"EmbeddingCache initialized: {len(self._cache)} entries from {self.cache_path}")
+        logger.info(f"EmbeddingCache initialized: {len(self._rows)} entries from {self.cache_path}")
     
     def _load(self):
         """Load cache from disk if exists."""
@@ -86,17 +95,56 @@ class EmbeddingCache:
                     data = json.load(f)
                     # Validate structure
                     if isinstance(data, dict):
-                        self._cache = data
-                        logger.info(f"Loaded {len(self._cache)} cached embeddings")
+                        matrix = np.array(list(data.values()), dtype=np.float32)
+                        if data and matrix.ndim != 2:
+                            raise ValueError(f"embeddings have shape {matrix.shape}")
+                        self._rows = {text_hash: row for row, text_hash in enumerate(data)}
+                        self._matrix = matrix if data else None
+                        logger.info(f"Loaded {len(self._rows)} cached embeddings")
                     else:
                         logger.warning("Invalid cache file format, starting fresh")
-                        self._cache = {}
+                        self._reset()
         except json.JSONDecodeError as e:
             logger.warning(f"Corrupted cache file, starting fresh: {e}")
-            self._cache = {}
+            self._reset()
         except Exception as e:
             logger.warning(f"Failed to load cache, starting fresh: {e}")
-            self._cache = {}
+            self._reset()
+    
+    def _reset(self):
+        """Drop all in-memory embeddings."""
+        self._rows = {}
+        self._matrix = None
+    
+    def _store(self, text_hash: str, embedding: np.ndarray):
+        """
+        Write an embedding into its matrix row (caller holds the lock).
+        
+        Args:
+            text_hash: Cache key
+            embedding: Embedding vector
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        
+        if self._matrix is None or self._matrix.shape[1:] != vector.shape:
+            if self._rows:
+                logger.warning(
+                    f"Embedding shape changed to {vector.shape}, "
+                    f"dropping {len(self._rows)} cached embeddings"
+                )
+            self._rows = {}
+            self._matrix = np.empty((_INITIAL_CAPACITY,) + vector.shape, dtype=np.float32)
+        
+        row = self._rows.get(text_hash)
+        if row is None:
+            row = len(self._rows)
+            if row == len(self._matrix):
+                grown = np.empty((2 * row,) + self._matrix.shape[1:], dtype=np.float32)
+                grown[:row] = self._matrix
+                self._matrix = grown
+            self._rows[text_hash] = row
+        
+        self._matrix[row] = vector
     
     def save(self) -> bool:
         """
@@ -116,14 +164,18 @@ class EmbeddingCache:
                 
                 # Write atomically using temp file
                 temp_path = self.cache_path.with_suffix(".tmp")
+                if self._rows:
+                    data = dict(zip(self._rows, self._matrix[:len(self._rows)].tolist()))
+                else:
+                    data = {}
                 with open(temp_path, "w", encoding="utf-8") as f:
-                    json.dump(self._cache, f)
+                    json.dump(data, f)
                 
                 # Rename temp to final (atomic on most systems)
                 temp_path.replace(self.cache_path)
                 
                 self._dirty = False
-                logger.info(f"Saved {len(self._cache)} embeddings to {self.cache_path}")
+                logger.info(f"Saved {len(self._rows)} embeddings to {self.cache_path}")
                 return True
                 
             except Exception as e:
@@ -143,9 +195,9 @@ class EmbeddingCache:
         text_hash = _hash_text(text)
         
         with self._lock:
-            if text_hash in self._cache:
-                embedding_list = self._cache[text_hash]
-                return np.array(embedding_list, dtype=np.float32)
+            row = self._rows.get(text_hash)
+            if row is not None:
+                return self._matrix[row].copy()
         
         return None
     
@@ -163,14 +215,39 @@ class EmbeddingCache:
         
         with self._lock:
             for text in texts:
-                text_hash = _hash_text(text)
-                if text_hash in self._cache:
-                    results[text] = np.array(self._cache[text_hash], dtype=np.float32)
-                else:
-                    results[text] = None
+                row = self._rows.get(_hash_text(text))
+                results[text] = self._matrix[row].copy() if row is not None else None
         
         return results
     
+    def get_matrix(self, texts: List[str]) -> Tuple[Optional[np.ndarray], List[int]]:
+        """
+        Gather cached embeddings for multiple texts into one matrix.
+        
+        Args:
+            texts: List of input texts
+            
+        Returns:
+            Tuple of (float32 matrix with one row per text, or None if the
+            cache is empty; indices of texts that are not cached, whose rows
+            are zero-filled)
+        """
+        text_hashes = [_hash_text(text) for text in texts]
+        
+        with self._lock:
+            rows = [self._rows.get(text_hash, -1) for text_hash in text_hashes]
+            missing = [i for i, row in enumerate(rows) if row < 0]
+            
+            if self._matrix is None:
+                return None, missing
+            
+            embeddings = self._matrix[rows]
+        
+        if missing:
+            embeddings[missing] = 0.0
+        
+        return embeddings, missing
+    
     def set(self, text: str, embedding: np.ndarray):
         """
         Store embedding in cache.
@@ -182,8 +259,7 @@ class EmbeddingCache:
         text_hash = _hash_text(text)
         
         with self._lock:
-            # Convert numpy array to list for JSON serialization
-            self._cache[text_hash] = embedding.tolist()
+            self._store(text_hash, embedding)
             self._dirty = True
     
     def set_batch(self, items: Dict[str, np.ndarray]):
@@ -195,20 +271,19 @@ class EmbeddingCache:
         """
         with self._lock:
             for text, embedding in items.items():
-                text_hash = _hash_text(text)
-                self._cache[text_hash] = embedding.tolist()
+                self._store(_hash_text(text), embedding)
             self._dirty = True
     
     def contains(self, text: str) -> bool:
         """Check if text is in cache."""
         text_hash = _hash_text(text)
         with self._lock:
-            return text_hash in self._cache
+            return text_hash in self._rows
     
     def clear(self):
         """Clear all cached embeddings."""
         with self._lock:
-            self._cache.clear()
+            self._reset()
             self._dirty = True
         logger.info("Embedding cache cleared")
     
@@ -216,7 +291,7 @@ class EmbeddingCache:
     def size(self) -> int:
         """Return number of cached embeddings."""
         with self._lock:
-            return len(self._cache)
+            return len(self._rows)
     
     @property
     def is_dirty(self) -> bool:
@@ -107,6 +107,10 @@ class EmbeddingService:
         self._model_initialized = False
         self._dimension: Optional[int] = None
         
+        # Model output is L2-normalized (normalize_embeddings=True) and the cache
+        # stores those vectors as-is, so consumers can skip re-normalizing
+        self.returns_normalized = True
+        
         # Track service availability
         self._available = True
         self._last_error: Optional[str] = None
@@ -290,60 +294,45 @@ class EmbeddingService:
         if not texts:
             return np.array([], dtype=np.float32).reshape(0, self.dimension)
         
-        # Separate cached vs uncached texts
-        results: List[Tuple[int, np.ndarray]] = []  # (original_index, embedding)
-        texts_to_fetch: List[Tuple[int, str]] = []  # (original_index, text)
-        
-        for i, text in enumerate(texts):
-            cached = self._cache.get(text)
-            if cached is not None:
-                results.append((i, cached))
-            else:
-                texts_to_fetch.append((i, text))
+        # Gather cached rows in one copy; uncached rows come back zero-filled
+        embeddings, missing = self._cache.get_matrix(texts)
         
-        cache_hits = len(results)
-        cache_misses = len(texts_to_fetch)
+        cache_misses = len(missing)
+        cache_hits = len(texts) - cache_misses
         
         if cache_hits > 0:
             logger.debug(f"Cache: {cache_hits} hits, {cache_misses} misses")
         
         # Generate uncached embeddings
-        if texts_to_fetch:
-            batch_texts = [text for _, text in texts_to_fetch]
-            batch_indices = [idx for idx, _ in texts_to_fetch]
+        if missing:
+            batch_texts = [texts[i] for i in missing]
             
             logger.info(f"Generating {len(batch_texts)} embeddings locally...")
             
             # Generate embeddings
-            embeddings, error = self._generate_embeddings(batch_texts)
+            generated, error = self._generate_embeddings(batch_texts)
             
-            if error or embeddings is None:
+            if error or generated is None:
                 raise EmbeddingServiceUnavailable(
                     f"Embedding service unavailable: {error}"
                 )
             
-            # Store results and cache
-            new_cache_items = {}
-            for j, embedding in enumerate(embeddings):
-                original_idx = batch_indices[j]
-                text = batch_texts[j]
-                results.append((original_idx, embedding))
-                new_cache_items[text] = embedding
+            # Fill the uncached rows (nothing cached: the batch is the result)
+            if cache_hits == 0:
+                embeddings = generated
+            else:
+                embeddings[missing] = generated
             
             # Batch save to cache
-            if new_cache_items:
-                self._cache.set_batch(new_cache_items)
+            self._cache.set_batch(dict(zip(batch_texts, generated)))
             
-            logger.debug(f"Generated {len(embeddings)} embeddings")
-        
-        # Sort by original index and stack into array
-        results.sort(key=lambda x: x[0])
+            logger.debug(f"Generated {len(generated)} embeddings")
         
         # Auto-save cache periodically
         if cache_misses > 0 and self._cache.is_dirty:
             self._cache.save()
         
-        return np.stack([emb for _, emb in results], axis=0)
+        return embeddings
     
     def get_embeddings_safe(
         self, 
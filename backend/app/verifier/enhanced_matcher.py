@@ -256,7 +256,9 @@ def calculate_hybrid_score_v3(
     semantic_similarity: float,
     bill_metadata: Dict,
     tieup_metadata: Dict,
-    category: str
+    category: str,
+    tieup_anchors: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None,
+    bill_anchors: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None
 ) -> Tuple[float, Dict]:
     """
     Calculate hybrid score with medical domain knowledge.
@@ -273,16 +275,29 @@ def calculate_hybrid_score_v3(
         bill_metadata: Bill item metadata
         tieup_metadata: Tie-up item metadata
         category: Category name
+        tieup_anchors: Precomputed extract_medical_anchors(tieup_text), if available
+        bill_anchors: Precomputed extract_medical_anchors(bill_text), if available
         
     Returns:
         Tuple of (final_score, breakdown_dict)
     """
     from app.verifier.partial_matcher import calculate_token_overlap
-    from app.verifier.medical_anchors import calculate_medical_anchor_score
+    from app.verifier.medical_anchors import (
+        calculate_medical_anchor_score,
+        calculate_medical_anchor_score_with_anchors,
+        score_anchor_triples,
+    )
     
     # Calculate components
     token_overlap = calculate_token_overlap(bill_text, tieup_text)
-    medical_score, medical_breakdown = calculate_medical_anchor_score(bill_text, tieup_text)
+    if tieup_anchors is not None and bill_anchors is not None:
+        medical_score, medical_breakdown = score_anchor_triples(bill_anchors, tieup_anchors)
+    elif tieup_anchors is not None:
+        medical_score, medical_breakdown = calculate_medical_anchor_score_with_anchors(
+            bill_text, tieup_anchors
+        )
+    else:
+        medical_score, medical_breakdown = calculate_medical_anchor_score(bill_text, tieup_text)
     
     # Weighted combination
     final_score = (
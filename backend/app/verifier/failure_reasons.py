@@ -17,6 +17,25 @@ from app.verifier.models import FailureReason
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Failure Reason Descriptions
+# =============================================================================
+
+_FAILURE_REASON_DESCRIPTIONS = {
+    FailureReason.NOT_IN_TIEUP: "Item not found in tie-up rate sheet",
+    FailureReason.LOW_SIMILARITY: "Best match below acceptance threshold",
+    FailureReason.PACKAGE_ONLY: "Item only exists as part of a package",
+    FailureReason.ADMIN_CHARGE: "Administrative charge or OCR artifact",
+    FailureReason.CATEGORY_CONFLICT: "Item found in different category",
+}
+
+# Attach descriptions directly to the enum members so lookups are a plain
+# attribute access instead of building/querying a dict on every call.
+for _reason, _desc in _FAILURE_REASON_DESCRIPTIONS.items():
+    _reason._description = _desc
+del _reason, _desc
+
+
 # =============================================================================
 # Failure Reason Determination
 # =============================================================================
@@ -138,20 +157,17 @@ def get_failure_reason_description(reason: FailureReason) -> str:
     Get human-readable description of failure reason.
     
     Args:
-        reason: FailureReason enum value
+        reason: FailureReason enum value (or its string value)
         
     Returns:
         Human-readable description
     """
-    descriptions = {
-        FailureReason.NOT_IN_TIEUP: "Item not found in tie-up rate sheet",
-        FailureReason.LOW_SIMILARITY: "Best match below acceptance threshold",
-        FailureReason.PACKAGE_ONLY: "Item only exists as part of a package",
-        FailureReason.ADMIN_CHARGE: "Administrative charge or OCR artifact",
-        FailureReason.CATEGORY_CONFLICT: "Item found in different category",
-    }
-    
-    return descriptions.get(reason, "Unknown failure reason")
+    try:
+        # Accept plain string values (e.g. read back from JSON/MongoDB)
+        reason = FailureReason(reason)
+    except ValueError:
+        return "Unknown failure reason"
+    return reason._description
 
 
 def should_retry_in_alternative_category(
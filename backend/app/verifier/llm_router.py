@@ -24,6 +24,7 @@ Environment Variables:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
@@ -75,20 +76,28 @@ class LLMMatchResult:
 # LLM Decision Cache
 # =============================================================================
 
+def _pair_key(term_a: str, term_b: str) -> int:
+    """64-bit BLAKE2b digest of a case-normalized text pair (cache key)."""
+    pair = f"{term_a.lower()}\x00{term_b.lower()}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(pair, digest_size=8).digest(), "little")
+
+
 class LLMDecisionCache:
     """
     In-memory cache for LLM decisions.
     Caches (text_pair) -> LLMMatchResult to avoid redundant LLM calls.
+    Entries are keyed by a 64-bit digest of the pair, so the (possibly long)
+    item names are not retained by the cache.
     """
     
     def __init__(self):
-        self._cache: Dict[Tuple[str, str], LLMMatchResult] = {}
+        self._cache: Dict[int, LLMMatchResult] = {}
         self._hits = 0
         self._misses = 0
     
     def get(self, term_a: str, term_b: str) -> Optional[LLMMatchResult]:
         """Get cached result for a text pair."""
-        key = (term_a.lower(), term_b.lower())
+        key = _pair_key(term_a, term_b)
         result = self._cache.get(key)
         if result is not None:
             self._hits += 1
@@ -99,7 +108,7 @@ class LLMDecisionCache:
     
     def set(self, term_a: str, term_b: str, result: LLMMatchResult):
         """Cache a result for a text pair."""
-        key = (term_a.lower(), term_b.lower())
+        key = _pair_key(term_a, term_b)
         self._cache[key] = result
     
     def clear(self):
@@ -17,9 +17,14 @@ Graceful Degradation:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import math
 import os
+import threading
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -72,6 +77,30 @@ ITEM_SIMILARITY_THRESHOLD = float(os.getenv("ITEM_SIMILARITY_THRESHOLD", "0.85")
 USE_V2_MATCHING = False  # V2 disabled by default - V1 has proven quality
 logger.info(f"Matching mode: {'V2 (Enhanced)' if USE_V2_MATCHING else 'V1 (Proven)'}")
 
+# FAISS index selection: small indices stay exact (IndexFlatIP), larger ones
+# switch to an HNSW graph for sub-linear k-NN search
+HNSW_MIN_INDEX_SIZE = int(os.getenv("FAISS_HNSW_MIN_INDEX_SIZE", "64"))
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = int(os.getenv("FAISS_HNSW_EF_SEARCH", "32"))
+
+# Vector encoding for non-HNSW indices: "fp16" (default, ~1e-5 similarity error),
+# "8bit" (quarter of the bytes, ~1e-3 error) or "none" (exact float32 IndexFlatIP)
+SCALAR_QUANTIZER = os.getenv("FAISS_SCALAR_QUANTIZER", "fp16").lower()
+_SCALAR_QUANTIZER_TYPES = {
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+    "8bit": faiss.ScalarQuantizer.QT_8bit,
+}
+
+# Very large indices can use an inverted-file index instead: vectors are clustered
+# into nlist = sqrt(n) lists and only nprobe of them are scanned per query.
+# Disabled by default (0) - HNSW keeps higher recall at rate-sheet sizes.
+IVF_MIN_INDEX_SIZE = int(os.getenv("FAISS_IVF_MIN_INDEX_SIZE", "0"))
+IVF_NPROBE = int(os.getenv("FAISS_IVF_NPROBE", "0"))  # 0 = max(1, nlist // 16)
+
+# On-disk FAISS index cache (skips re-embedding unchanged rate sheets at startup)
+INDEX_CACHE_MANIFEST = "manifest.json"
+
 # UNIFIED THRESHOLDS: Single source of truth (V1 proven values)
 THRESHOLDS = {
     "semantic_auto_match": 0.85,   # High confidence semantic match
@@ -130,27 +159,82 @@ class ItemMatch(MatchResult):
     confidence_decision: Optional[str] = None  # MatchDecision enum value
 
 
+def _exact_key(text: str) -> str:
+    """Key for exact-name lookups: lowercase with whitespace collapsed."""
+    return " ".join(text.lower().split())
+
+
 # =============================================================================
 # FAISS Index Wrapper
 # =============================================================================
 
+# Per-thread pool of (1, dimension) float32 query buffers, keyed by dimension
+_query_scratch = threading.local()
+
+
+def _query_buffer(dimension: int) -> np.ndarray:
+    """Return this thread's reusable (1, dimension) float32 query buffer."""
+    pool: Optional[Dict[int, np.ndarray]] = getattr(_query_scratch, "pool", None)
+    if pool is None:
+        pool = _query_scratch.pool = {}
+    buffer = pool.get(dimension)
+    if buffer is None:
+        buffer = pool[dimension] = np.empty((1, dimension), dtype=np.float32)
+    return buffer
+
+
 class FAISSIndex:
     """
     Wrapper around FAISS index for similarity search.
     Uses inner product (cosine similarity with normalized vectors).
+    
+    Indices expected to hold more than HNSW_MIN_INDEX_SIZE vectors use an
+    HNSW graph (approximate, sub-linear search); smaller ones use a
+    brute-force scan over scalar-quantized vectors (see SCALAR_QUANTIZER).
     """
     
-    def __init__(self, dimension: int):
+    def __init__(
+        self,
+        dimension: int,
+        expected_size: int = 0,
+        ef_search: int = HNSW_EF_SEARCH,
+        normalize_queries: bool = True,
+    ):
         """
         Initialize FAISS index.
         
         Args:
             dimension: Embedding dimension
+            expected_size: Number of vectors that will be added (selects index type)
+            ef_search: HNSW search depth (speed/recall trade-off, HNSW only)
+            normalize_queries: L2-normalize queries before searching (disable
+                when queries are already unit vectors)
         """
         self.dimension = dimension
-        # Use IndexFlatIP for inner product (cosine similarity with L2 normalized vectors)
-        self.index = faiss.IndexFlatIP(dimension)
+        self.normalize_queries = normalize_queries
+        if IVF_MIN_INDEX_SIZE and expected_size >= IVF_MIN_INDEX_SIZE:
+            # Inverted lists over a flat inner-product coarse quantizer (trained in add())
+            nlist = max(1, int(math.sqrt(expected_size)))
+            self.index = faiss.IndexIVFFlat(
+                faiss.IndexFlatIP(dimension), dimension, nlist, faiss.METRIC_INNER_PRODUCT
+            )
+            self.index.nprobe = IVF_NPROBE or max(1, nlist // 16)
+        elif expected_size > HNSW_MIN_INDEX_SIZE:
+            # HNSW graph with inner product metric (cosine on L2 normalized vectors)
+            self.index = faiss.IndexHNSWFlat(dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            self.index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            self.index.hnsw.efSearch = ef_search
+        elif SCALAR_QUANTIZER in _SCALAR_QUANTIZER_TYPES:
+            # Brute-force inner product over fp16/int8-encoded vectors (less memory traffic)
+            self.index = faiss.IndexScalarQuantizer(
+                dimension, _SCALAR_QUANTIZER_TYPES[SCALAR_QUANTIZER], faiss.METRIC_INNER_PRODUCT
+            )
+        else:
+            # Use IndexFlatIP for inner product (cosine similarity with L2 normalized vectors)
+            self.index = faiss.IndexFlatIP(dimension)
         self.texts: List[str] = []
+        # Per-thread (distances, labels) buffers reused by search_best()
+        self._best_buffers = threading.local()
     
     def add(self, embeddings: np.ndarray, texts: List[str]):
         """
@@ -165,9 +249,24 @@ class FAISSIndex:
             
         # L2 normalize for cosine similarity
         faiss.normalize_L2(embeddings)
+        # IVF learns its coarse centroids and 8-bit scalar quantizers their
+        # per-dimension ranges before the first add
+        if not self.index.is_trained:
+            self.index.train(embeddings)
         self.index.add(embeddings)
         self.texts.extend(texts)
     
+    @property
+    def nprobe(self) -> Optional[int]:
+        """Inverted lists scanned per query (IVF indices only, else None)."""
+        return self.index.nprobe if isinstance(self.index, faiss.IndexIVF) else None
+    
+    @nprobe.setter
+    def nprobe(self, value: int):
+        if not isinstance(self.index, faiss.IndexIVF):
+            raise ValueError("nprobe only applies to IVF indices")
+        self.index.nprobe = max(1, min(int(value), self.index.nlist))
+    
     def search(self, query_embedding: np.ndarray, k: int = 1) -> List[Tuple[int, float]]:
         """
         Search for k nearest neighbors.
@@ -182,22 +281,94 @@ class FAISSIndex:
         if self.index.ntotal == 0:
             return []
         
-        # Reshape and normalize query
-        query = query_embedding.reshape(1, -1).astype(np.float32)
-        faiss.normalize_L2(query)
+        # Copy into the pooled float32 buffer and normalize in place
+        query = _query_buffer(self.dimension)
+        np.copyto(query, query_embedding.reshape(1, -1))
+        if self.normalize_queries:
+            faiss.normalize_L2(query)
         
         # Search
         k = min(k, self.index.ntotal)
         distances, indices = self.index.search(query, k)
         
-        results = []
-        for i in range(k):
-            idx = int(indices[0][i])
-            # Cosine similarity from inner product (already normalized)
-            similarity = float(distances[0][i])
-            results.append((idx, similarity))
+        # Cosine similarity from inner product (already normalized); tolist()
+        # converts in C. HNSW pads with -1 when it finds fewer than k neighbours.
+        return [
+            (idx, similarity)
+            for idx, similarity in zip(indices[0].tolist(), distances[0].tolist())
+            if idx >= 0
+        ]
+    
+    def search_best(self, query_embedding: np.ndarray) -> Optional[Tuple[int, float]]:
+        """
+        Search for the single nearest neighbor (top-1) without per-call allocations.
+        
+        Reuses preallocated per-thread query/output buffers instead of
+        allocating new arrays on every call.
+        
+        Args:
+            query_embedding: Query vector of shape (dimension,)
+            
+        Returns:
+            (index, similarity_score) of the best match, or None if the index is empty
+        """
+        if self.index.ntotal == 0:
+            return None
         
-        return results
+        buffers = getattr(self._best_buffers, "value", None)
+        if buffers is None:
+            buffers = (
+                np.empty((1, 1), dtype=np.float32),
+                np.empty((1, 1), dtype=np.int64),
+            )
+            self._best_buffers.value = buffers
+        distances, labels = buffers
+        
+        # Copy (casting to float32) into the pooled buffer, then normalize in place
+        query = _query_buffer(self.dimension)
+        np.copyto(query, query_embedding.reshape(1, -1))
+        if self.normalize_queries:
+            faiss.normalize_L2(query)
+        
+        self.index.search(query, 1, D=distances, I=labels)
+        
+        idx = int(labels[0, 0])
+        # HNSW reports -1 when no neighbour was found
+        if idx < 0:
+            return None
+        return idx, float(distances[0, 0])
+    
+    def search_batch(
+        self, query_embeddings: np.ndarray, k: int = 1
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Search for k nearest neighbors of many queries in one FAISS call.
+        
+        Args:
+            query_embeddings: Query matrix of shape (n, dimension)
+            k: Number of results to return per query
+            
+        Returns:
+            One list of (index, similarity_score) tuples per query row
+        """
+        if self.index.ntotal == 0 or len(query_embeddings) == 0:
+            return [[] for _ in range(len(query_embeddings))]
+        
+        if self.normalize_queries:
+            # Copy so in-place normalization never mutates the caller's array
+            queries = np.array(query_embeddings, dtype=np.float32)
+            faiss.normalize_L2(queries)
+        else:
+            queries = np.ascontiguousarray(query_embeddings, dtype=np.float32)
+        
+        k = min(k, self.index.ntotal)
+        distances, indices = self.index.search(queries, k)
+        
+        # Drop -1 labels (HNSW pads with them when it finds fewer than k neighbours)
+        return [
+            [(idx, similarity) for idx, similarity in zip(row_indices, row_distances) if idx >= 0]
+            for row_indices, row_distances in zip(indices.tolist(), distances.tolist())
+        ]
     
     def search_with_threshold(
         self, 
@@ -214,11 +385,11 @@ class FAISSIndex:
         Returns:
             Tuple of (index, similarity, text) if match found, else None
         """
-        results = self.search(query_embedding, k=1)
-        if not results:
+        best = self.search_best(query_embedding)
+        if best is None:
             return None
             
-        idx, similarity = results[0]
+        idx, similarity = best
         if similarity >= threshold:
             return (idx, similarity, self.texts[idx])
         return None
@@ -227,6 +398,55 @@ class FAISSIndex:
     def size(self) -> int:
         """Return number of vectors in the index."""
         return self.index.ntotal
+    
+    def save(self, path: Path):
+        """
+        Persist the index to <path>.faiss and its texts to <path>.json.
+        
+        Files are written to a temp name and renamed into place, so an index
+        still memory-mapped from the old file is never truncated underneath.
+        
+        Args:
+            path: Path prefix for the two files
+        """
+        faiss.write_index(self.index, f"{path}.faiss.tmp")
+        os.replace(f"{path}.faiss.tmp", f"{path}.faiss")
+        with open(f"{path}.json.tmp", "w", encoding="utf-8") as f:
+            json.dump(self.texts, f)
+        os.replace(f"{path}.json.tmp", f"{path}.json")
+    
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        ef_search: int = HNSW_EF_SEARCH,
+        normalize_queries: bool = True,
+    ) -> "FAISSIndex":
+        """
+        Load an index saved with save(), memory-mapped and read-only.
+        
+        Args:
+            path: Path prefix used when saving
+            ef_search: HNSW search depth to apply (HNSW only)
+            normalize_queries: L2-normalize queries before searching
+            
+        Returns:
+            FAISSIndex backed by the on-disk index
+        """
+        index = faiss.read_index(
+            f"{path}.faiss", faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+        )
+        with open(f"{path}.json", "r", encoding="utf-8") as f:
+            texts = json.load(f)
+        
+        loaded = cls(index.d, normalize_queries=normalize_queries)
+        loaded.index = index
+        if hasattr(index, "hnsw"):
+            index.hnsw.efSearch = ef_search
+        elif isinstance(index, faiss.IndexIVF) and IVF_NPROBE:
+            loaded.nprobe = IVF_NPROBE
+        loaded.texts = texts
+        return loaded
 
 
 # =============================================================================
@@ -239,7 +459,8 @@ class SemanticMatcher:
     Builds FAISS indices from tie-up rate sheets and performs matching.
     
     Graceful Degradation:
-    - If embedding service fails during indexing, skips with warning
+    - If embedding service fails during indexing, indexing is aborted as a
+      whole (all tie-up texts are embedded in one batch) and the error is kept
     - If embedding service fails during query, returns error result
     - Never crashes the application
     """
@@ -248,6 +469,9 @@ class SemanticMatcher:
         self, 
         embedding_service: Optional[EmbeddingService] = None,
         llm_router: Optional[LLMRouter] = None,
+        ef_search: int = HNSW_EF_SEARCH,
+        persist_indices: bool = True,
+        index_cache_dir: Optional[str] = None,
     ):
         """
         Initialize the semantic matcher.
@@ -255,10 +479,30 @@ class SemanticMatcher:
         Args:
             embedding_service: Embedding service instance (uses global if None)
             llm_router: LLM router instance (uses global if None)
+            ef_search: HNSW efSearch for large indices (higher = better recall, slower)
+            persist_indices: Save built indices to disk and reuse them when the
+                rate sheets are unchanged
+            index_cache_dir: Index cache directory (defaults to FAISS_INDEX_CACHE_DIR
+                env var or DATA_DIR/faiss_index_cache)
         """
         self.embedding_service = embedding_service or get_embedding_service()
         self.llm_router = llm_router or get_llm_router()
         self.dimension = self.embedding_service.dimension
+        self.ef_search = ef_search
+        # Skip per-query L2 normalization when the service already emits unit vectors
+        self._normalize_queries = not getattr(
+            self.embedding_service, "returns_normalized", False
+        )
+        
+        # On-disk index cache
+        self._index_cache_dir: Optional[Path] = None
+        if persist_indices:
+            if index_cache_dir is None:
+                from app.config import DATA_DIR
+                index_cache_dir = os.getenv(
+                    "FAISS_INDEX_CACHE_DIR", str(DATA_DIR / "faiss_index_cache")
+                )
+            self._index_cache_dir = Path(index_cache_dir)
         
         # Hospital-level index
         self._hospital_index: Optional[FAISSIndex] = None
@@ -270,7 +514,14 @@ class SemanticMatcher:
         
         # Per-category item indices: (hospital_name, category_name) -> FAISSIndex
         self._item_indices: Dict[Tuple[str, str], FAISSIndex] = {}
-        self._item_refs: Dict[Tuple[str, str], List[TieUpItem]] = {}
+        # Column-wise item data aligned with item index rows: names, rates, objects
+        self._item_cols: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+        # Exact-name fast path: (hospital_name, category_name) -> {exact key -> item index}
+        self._item_exact: Dict[Tuple[str, str], Dict[str, int]] = {}
+        # Content hash of each item shard's names, for warm re-indexing
+        self._shard_hash: Dict[Tuple[str, str], str] = {}
+        # Shards set aside by clear_indices(): cat_key -> (hash, index, exact lookup)
+        self._retained_shards: Dict[Tuple[str, str], Tuple[str, FAISSIndex, Dict[str, int]]] = {}
         
         # Track indexing status
         self._indexing_error: Optional[str] = None
@@ -292,6 +543,15 @@ class SemanticMatcher:
         """Get indexing error message if any."""
         return self._indexing_error
     
+    def _new_index(self, expected_size: int) -> FAISSIndex:
+        """Create a FAISSIndex configured for this matcher."""
+        return FAISSIndex(
+            self.dimension,
+            expected_size=expected_size,
+            ef_search=self.ef_search,
+            normalize_queries=self._normalize_queries,
+        )
+    
     def index_rate_sheets(self, rate_sheets: List[TieUpRateSheet]) -> bool:
         """
         Build FAISS indices from tie-up rate sheets.
@@ -301,9 +561,15 @@ class SemanticMatcher:
         2. Category indices for each hospital
         3. Item indices for each category in each hospital
         
+        All hospital, category and item names are de-duplicated and embedded
+        in one batched call, then sliced per index.
+        
+        Built indices are saved to the index cache directory; when the same
+        rate sheets are indexed again they are memory-mapped from disk and
+        nothing is embedded.
+        
         Graceful Degradation:
         - If embedding service fails, logs warning and returns False
-        - Partial indexing is allowed (some categories may be indexed)
         
         Args:
             rate_sheets: List of TieUpRateSheet objects
@@ -320,20 +586,67 @@ class SemanticMatcher:
         self._hospital_rate_sheets = rate_sheets
         self._indexing_error = None
         
+        fingerprint = self._rate_sheets_fingerprint(rate_sheets)
+        if self._load_index_cache(rate_sheets, fingerprint):
+            return True
+        
         try:
-            # 1. Index hospital names
-            hospital_names = [rs.hospital_name for rs in rate_sheets]
-            hospital_embeddings, error = self.embedding_service.get_embeddings_safe(hospital_names)
+            # 0. Item shards whose names are unchanged since the last indexing
+            #    (or since clear_indices) keep their FAISS index as-is
+            previous_shards = dict(self._retained_shards)
+            for cat_key, shard_hash in self._shard_hash.items():
+                if cat_key in self._item_indices:
+                    previous_shards[cat_key] = (
+                        shard_hash, self._item_indices[cat_key], self._item_exact[cat_key]
+                    )
+            
+            cat_hashes: Dict[int, str] = {}
+            reused: Dict[int, Tuple[str, FAISSIndex, Dict[str, int]]] = {}
+            for rs in rate_sheets:
+                for cat in rs.categories:
+                    if cat.items:
+                        cat_hashes[id(cat)] = self._shard_hash_of(cat.items)
+                        previous = previous_shards.get(
+                            (rs.hospital_name.lower(), cat.category_name.lower())
+                        )
+                        if previous is not None and previous[0] == cat_hashes[id(cat)]:
+                            reused[id(cat)] = previous
+            
+            # 1. Collect every unique text (hospitals, categories, items) so the
+            #    whole tie-up corpus is embedded in a single batched call
+            all_texts: List[str] = []
+            text_to_idx: Dict[str, int] = {}
+            
+            def _register(text: str):
+                if text not in text_to_idx:
+                    text_to_idx[text] = len(all_texts)
+                    all_texts.append(text)
+            
+            for rs in rate_sheets:
+                _register(rs.hospital_name)
+                for cat in rs.categories:
+                    _register(cat.category_name)
+                    if id(cat) not in reused:
+                        for item in cat.items:
+                            _register(item.item_name)
+            
+            all_embeddings, error = self.embedding_service.get_embeddings_safe(all_texts)
             
-            if error or hospital_embeddings is None:
-                self._indexing_error = f"Failed to embed hospital names: {error}"
+            if error or all_embeddings is None:
+                self._indexing_error = f"Failed to embed rate sheets: {error}"
                 logger.error(self._indexing_error)
                 return False
             
-            self._hospital_index = FAISSIndex(self.dimension)
-            self._hospital_index.add(hospital_embeddings, hospital_names)
+            def _gather(texts: List[str]) -> np.ndarray:
+                # Fancy indexing returns a contiguous copy, safe for in-place normalization
+                return all_embeddings[[text_to_idx[t] for t in texts]]
+            
+            # 2. Index hospital names
+            hospital_names = [rs.hospital_name for rs in rate_sheets]
+            self._hospital_index = self._new_index(len(hospital_names))
+            self._hospital_index.add(_gather(hospital_names), hospital_names)
             
-            # 2. Index categories and items for each hospital
+            # 3. Index categories and items for each hospital
             categories_indexed = 0
             items_indexed = 0
             
@@ -343,16 +656,9 @@ class SemanticMatcher:
                 # Category index for this hospital
                 if rs.categories:
                     category_names = [cat.category_name for cat in rs.categories]
-                    category_embeddings, error = self.embedding_service.get_embeddings_safe(category_names)
                     
-                    if error or category_embeddings is None:
-                        logger.warning(
-                            f"Skipping category indexing for {rs.hospital_name}: {error}"
-                        )
-                        continue
-                    
-                    cat_index = FAISSIndex(self.dimension)
-                    cat_index.add(category_embeddings, category_names)
+                    cat_index = self._new_index(len(category_names))
+                    cat_index.add(_gather(category_names), category_names)
                     
                     self._category_indices[hospital_key] = cat_index
                     self._category_refs[hospital_key] = rs.categories
@@ -362,31 +668,32 @@ class SemanticMatcher:
                     for cat in rs.categories:
                         if cat.items:
                             cat_key = (hospital_key, cat.category_name.lower())
-                            item_names = [item.item_name for item in cat.items]
-                            item_embeddings, error = self.embedding_service.get_embeddings_safe(item_names)
                             
-                            if error or item_embeddings is None:
-                                logger.warning(
-                                    f"Skipping item indexing for {rs.hospital_name}/{cat.category_name}: {error}"
-                                )
-                                continue
-                            
-                            item_index = FAISSIndex(self.dimension)
-                            item_index.add(item_embeddings, item_names)
+                            if id(cat) in reused:
+                                _, item_index, item_exact = reused[id(cat)]
+                            else:
+                                item_names = [item.item_name for item in cat.items]
+                                item_index = self._new_index(len(item_names))
+                                item_index.add(_gather(item_names), item_names)
+                                item_exact = self._build_exact_lookup(item_names)
                             
                             self._item_indices[cat_key] = item_index
-                            self._item_refs[cat_key] = cat.items
+                            self._item_cols[cat_key] = self._build_item_columns(cat.items)
+                            self._item_exact[cat_key] = item_exact
+                            self._shard_hash[cat_key] = cat_hashes[id(cat)]
                             items_indexed += 1
             
             self._indexed = True
             logger.info(
                 f"Indexed: {self._hospital_index.size} hospitals, "
                 f"{categories_indexed} category indices, "
-                f"{items_indexed} item indices"
+                f"{items_indexed} item indices ({len(reused)} reused unchanged)"
             )
+            self._retained_shards.clear()
             
             # Save cache after indexing
             self.embedding_service.save_cache()
+            self._save_index_cache(rate_sheets, fingerprint)
             
             return True
             
@@ -399,6 +706,115 @@ class SemanticMatcher:
             logger.error(self._indexing_error, exc_info=True)
             return False
     
+    def _rate_sheets_fingerprint(self, rate_sheets: List[TieUpRateSheet]) -> str:
+        """Hash rate sheet content plus everything that shapes the built indices."""
+        payload = json.dumps(
+            {
+                "rate_sheets": [rs.model_dump(mode="json") for rs in rate_sheets],
+                "model": getattr(self.embedding_service, "model_name", None),
+                "dimension": self.dimension,
+                "hnsw": [HNSW_MIN_INDEX_SIZE, HNSW_M, HNSW_EF_CONSTRUCTION],
+                "ivf_min_index_size": IVF_MIN_INDEX_SIZE,
+                "scalar_quantizer": SCALAR_QUANTIZER,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _save_index_cache(self, rate_sheets: List[TieUpRateSheet], fingerprint: str):
+        """Persist all built indices (best effort, never raises)."""
+        if self._index_cache_dir is None:
+            return
+        
+        cache_dir = self._index_cache_dir
+        manifest_path = cache_dir / INDEX_CACHE_MANIFEST
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Invalidate first so a partially written cache is never loaded
+            manifest_path.unlink(missing_ok=True)
+            
+            self._hospital_index.save(cache_dir / "hospitals")
+            for i, rs in enumerate(rate_sheets):
+                hospital_key = rs.hospital_name.lower()
+                if rs.categories:
+                    self._category_indices[hospital_key].save(cache_dir / f"categories_{i}")
+                for j, cat in enumerate(rs.categories):
+                    if cat.items:
+                        cat_key = (hospital_key, cat.category_name.lower())
+                        self._item_indices[cat_key].save(cache_dir / f"items_{i}_{j}")
+            
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint}, f)
+            logger.info(f"Saved FAISS indices to {cache_dir}")
+        except Exception as e:
+            logger.warning(f"Failed to save FAISS index cache: {e}")
+    
+    def _load_index_cache(self, rate_sheets: List[TieUpRateSheet], fingerprint: str) -> bool:
+        """
+        Load indices saved for identical rate sheets (never raises).
+        
+        Returns:
+            True if all indices were loaded from disk, False otherwise
+        """
+        if self._index_cache_dir is None:
+            return False
+        
+        cache_dir = self._index_cache_dir
+        try:
+            with open(cache_dir / INDEX_CACHE_MANIFEST, "r", encoding="utf-8") as f:
+                if json.load(f).get("fingerprint") != fingerprint:
+                    return False
+        except (OSError, ValueError):
+            return False
+        
+        def _load(name: str) -> FAISSIndex:
+            return FAISSIndex.load(
+                cache_dir / name,
+                ef_search=self.ef_search,
+                normalize_queries=self._normalize_queries,
+            )
+        
+        try:
+            hospital_index = _load("hospitals")
+            category_indices: Dict[str, FAISSIndex] = {}
+            category_refs: Dict[str, List[TieUpCategory]] = {}
+            item_indices: Dict[Tuple[str, str], FAISSIndex] = {}
+            item_cols: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+            item_exact: Dict[Tuple[str, str], Dict[str, int]] = {}
+            shard_hashes: Dict[Tuple[str, str], str] = {}
+            
+            for i, rs in enumerate(rate_sheets):
+                hospital_key = rs.hospital_name.lower()
+                if rs.categories:
+                    category_indices[hospital_key] = _load(f"categories_{i}")
+                    category_refs[hospital_key] = rs.categories
+                for j, cat in enumerate(rs.categories):
+                    if cat.items:
+                        cat_key = (hospital_key, cat.category_name.lower())
+                        item_indices[cat_key] = _load(f"items_{i}_{j}")
+                        item_cols[cat_key] = self._build_item_columns(cat.items)
+                        item_exact[cat_key] = self._build_exact_lookup(item_indices[cat_key].texts)
+                        shard_hashes[cat_key] = self._shard_hash_of(cat.items)
+        except Exception as e:
+            logger.warning(f"Failed to load FAISS index cache, re-indexing: {e}")
+            return False
+        
+        self._hospital_index = hospital_index
+        self._category_indices.update(category_indices)
+        self._category_refs.update(category_refs)
+        self._item_indices.update(item_indices)
+        self._item_cols.update(item_cols)
+        self._item_exact.update(item_exact)
+        self._shard_hash.update(shard_hashes)
+        self._retained_shards.clear()
+        self._indexed = True
+        
+        logger.info(
+            f"Loaded FAISS indices from {cache_dir}: {hospital_index.size} hospitals, "
+            f"{len(category_indices)} category indices, {len(item_indices)} item indices"
+        )
+        return True
+    
     def match_hospital(self, hospital_name: str) -> HospitalMatch:
         """
         Match a bill hospital name to the best tie-up hospital.
@@ -453,8 +869,8 @@ class SemanticMatcher:
             )
         
         # Find best match
-        results = self._hospital_index.search(query_embedding, k=1)
-        if not results:
+        best = self._hospital_index.search_best(query_embedding)
+        if best is None:
             return HospitalMatch(
                 matched_text=None,
                 similarity=0.0,
@@ -462,7 +878,7 @@ class SemanticMatcher:
                 rate_sheet=None
             )
         
-        idx, similarity = results[0]
+        idx, similarity = best
         matched_name = self._hospital_index.texts[idx]
         rate_sheet = self._hospital_rate_sheets[idx]
         
@@ -530,8 +946,8 @@ class SemanticMatcher:
             )
         
         # Find best match
-        results = cat_index.search(query_embedding, k=1)
-        if not results:
+        best = cat_index.search_best(query_embedding)
+        if best is None:
             return CategoryMatch(
                 matched_text=None,
                 similarity=0.0,
@@ -539,7 +955,7 @@ class SemanticMatcher:
                 category=None
             )
         
-        idx, similarity = results[0]
+        idx, similarity = best
         matched_name = cat_index.texts[idx]
         category = cat_refs[idx]
         
@@ -587,28 +1003,7 @@ class SemanticMatcher:
         """
         self._total_matches += 1
         
-        # CRITICAL: Extract medical core FIRST (before any other processing)
-        # This removes inventory metadata: lot numbers, SKUs, expiry dates, brand suffixes
-        # Example: "(30049099) NICORANDIL-TABLET-5MG-KORANDIL- |GTF" → "nicorandil 5mg"
-        from app.verifier.medical_core_extractor import extract_medical_core
-        medical_core = extract_medical_core(item_name)
-        
-        # Then normalize the medical core (remove doctor names, etc.)
-        from app.verifier.text_normalizer import normalize_bill_item_text
-        normalized_item_name = normalize_bill_item_text(medical_core)
-        
-        # Log extraction and normalization for debugging
-        if medical_core != item_name.lower().strip():
-            logger.debug(
-                f"Medical core extracted: '{item_name}' → '{medical_core}'"
-            )
-        if normalized_item_name != medical_core.lower().strip():
-            logger.debug(
-                f"Normalized: '{medical_core}' → '{normalized_item_name}'"
-            )
-        
-        # Use normalized medical core for matching
-        item_name_for_matching = normalized_item_name if normalized_item_name else item_name
+        item_name_for_matching = self._normalize_item_for_matching(item_name)
         
         cat_key = (hospital_name.lower(), category_name.lower())
         
@@ -623,22 +1018,15 @@ class SemanticMatcher:
             )
         
         item_index = self._item_indices[cat_key]
-        item_refs = self._item_refs[cat_key]
+        item_objects = self._item_cols[cat_key]["objects"]
         
         # EXACT MATCH FAST PATH: Check for identical strings before semantic search
         # This guarantees 100% accuracy for exact matches and avoids unnecessary embeddings
-        for idx, tieup_text in enumerate(item_index.texts):
-            if item_name_for_matching.lower().strip() == tieup_text.lower().strip():
-                logger.info(
-                    f"Exact match found (fast path): '{item_name}' → '{tieup_text}' (confidence=1.0)"
-                )
-                return ItemMatch(
-                    matched_text=tieup_text,
-                    similarity=1.0,  # Perfect match
-                    index=idx,
-                    item=item_refs[idx],
-                    normalized_item_name=item_name_for_matching
-                )
+        exact_match = self._exact_item_match(
+            item_name, item_name_for_matching, cat_key, item_index, item_objects
+        )
+        if exact_match is not None:
+            return exact_match
         
         # Get embedding for query item (with graceful degradation)
         try:
@@ -669,6 +1057,256 @@ class SemanticMatcher:
         k = min(3, item_index.size)  # Get top-3 candidates (or fewer if index is small)
         results = item_index.search(query_embedding, k=k)
         
+        return self._resolve_item_candidates(
+            item_name=item_name,
+            item_name_for_matching=item_name_for_matching,
+            item_index=item_index,
+            item_objects=item_objects,
+            results=results,
+            use_llm=use_llm,
+        )
+    
+    def match_items_batch(
+        self,
+        item_names: List[str],
+        hospital_name: str,
+        category_name: str,
+        use_llm: bool = True,
+    ) -> List[ItemMatch]:
+        """
+        Match many bill items of one category in a single batched pass.
+        
+        Equivalent to calling match_item() for each name, but all queries that
+        miss the exact-match fast path are embedded with one batched call and
+        searched with one (n, dimension) FAISS query.
+        
+        When V2 matching is enabled, falls back to per-item match_item_v2().
+        
+        Args:
+            item_names: Item names from the bill (will be normalized)
+            hospital_name: Matched hospital name
+            category_name: Matched category name
+            use_llm: Whether to use LLM for borderline cases (default True)
+            
+        Returns:
+            One ItemMatch per input name, in the same order (never crashes)
+        """
+        if USE_V2_MATCHING and V2_AVAILABLE:
+            return [
+                self.match_item_v2(name, hospital_name, category_name, None, use_llm)
+                for name in item_names
+            ]
+        
+        self._total_matches += len(item_names)
+        
+        from app.verifier.medical_core_extractor import extract_medical_core_batch
+        medical_cores = extract_medical_core_batch(item_names)
+        normalized_names = [
+            self._normalize_item_for_matching(name, core)
+            for name, core in zip(item_names, medical_cores)
+        ]
+        
+        cat_key = (hospital_name.lower(), category_name.lower())
+        
+        if cat_key not in self._item_indices:
+            logger.warning(f"No item index for: {hospital_name}/{category_name}")
+            return [
+                ItemMatch(
+                    matched_text=None,
+                    similarity=0.0,
+                    index=-1,
+                    item=None,
+                    normalized_item_name=normalized
+                )
+                for normalized in normalized_names
+            ]
+        
+        item_index = self._item_indices[cat_key]
+        item_objects = self._item_cols[cat_key]["objects"]
+        
+        matches: List[Optional[ItemMatch]] = [None] * len(item_names)
+        pending: List[int] = []
+        
+        for pos, (name, normalized) in enumerate(zip(item_names, normalized_names)):
+            matches[pos] = self._exact_item_match(
+                name, normalized, cat_key, item_index, item_objects
+            )
+            if matches[pos] is None:
+                pending.append(pos)
+        
+        if not pending:
+            return matches
+        
+        # Embed every remaining query in one batched call
+        query_embeddings, error = self.embedding_service.get_embeddings_safe(
+            [normalized_names[pos] for pos in pending]
+        )
+        
+        if error or query_embeddings is None:
+            logger.warning(f"Embedding service unavailable for batch item match: {error}")
+            for pos in pending:
+                matches[pos] = ItemMatch(
+                    matched_text=None,
+                    similarity=0.0,
+                    index=-1,
+                    item=None,
+                    normalized_item_name=normalized_names[pos],
+                    error=f"Embedding service temporarily unavailable: {error}"
+                )
+            return matches
+        
+        # Top-3 candidates for every query in one FAISS search
+        k = min(3, item_index.size)
+        batch_results = item_index.search_batch(query_embeddings, k=k)
+        
+        for pos, results in zip(pending, batch_results):
+            matches[pos] = self._resolve_item_candidates(
+                item_name=item_names[pos],
+                item_name_for_matching=normalized_names[pos],
+                item_index=item_index,
+                item_objects=item_objects,
+                results=results,
+                use_llm=use_llm,
+            )
+        
+        return matches
+    
+    def _normalize_item_for_matching(
+        self, item_name: str, medical_core: Optional[str] = None
+    ) -> str:
+        """
+        Reduce a raw bill item name to the text used for matching.
+        
+        Args:
+            item_name: Item name from the bill
+            medical_core: Already extracted medical core of item_name, if any
+            
+        Returns:
+            Normalized medical core (falls back to the raw name if empty)
+        """
+        # CRITICAL: Extract medical core FIRST (before any other processing)
+        # This removes inventory metadata: lot numbers, SKUs, expiry dates, brand suffixes
+        # Example: "(30049099) NICORANDIL-TABLET-5MG-KORANDIL- |GTF" → "nicorandil 5mg"
+        if medical_core is None:
+            from app.verifier.medical_core_extractor import extract_medical_core
+            medical_core = extract_medical_core(item_name)
+        
+        # Then normalize the medical core (remove doctor names, etc.)
+        from app.verifier.text_normalizer import normalize_bill_item_text
+        normalized_item_name = normalize_bill_item_text(medical_core)
+        
+        # Log extraction and normalization for debugging
+        if medical_core != item_name.lower().strip():
+            logger.debug(
+                f"Medical core extracted: '{item_name}' → '{medical_core}'"
+            )
+        if normalized_item_name != medical_core.lower().strip():
+            logger.debug(
+                f"Normalized: '{medical_core}' → '{normalized_item_name}'"
+            )
+        
+        # Use normalized medical core for matching
+        return normalized_item_name if normalized_item_name else item_name
+    
+    @staticmethod
+    def _shard_hash_of(items: List[TieUpItem]) -> str:
+        """Content hash of a category's item names (what its FAISS index holds)."""
+        names = "\x00".join(item.item_name for item in items)
+        return hashlib.blake2b(names.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _build_item_columns(items: List[TieUpItem]) -> Dict[str, np.ndarray]:
+        """
+        Split tie-up items into parallel arrays aligned with item index rows.
+        
+        With V2 matching on, also precomputes each item's medical core and its
+        (dosage, modality, bodypart) anchors, which are fixed once indexed.
+        """
+        objects = np.empty(len(items), dtype=object)
+        objects[:] = items
+        cols = {
+            "names": np.array([item.item_name for item in items], dtype=object),
+            "rates": np.fromiter((item.rate for item in items), dtype=np.float64, count=len(items)),
+            "objects": objects,
+        }
+        
+        if USE_V2_MATCHING and V2_AVAILABLE:
+            from app.verifier.medical_anchors import extract_medical_anchors
+            
+            cores = [extract_medical_core_v2(item.item_name) for item in items]
+            cols["cores"] = np.empty(len(items), dtype=object)
+            cols["cores"][:] = cores
+            cols["anchors"] = np.empty(len(items), dtype=object)
+            for row, core in enumerate(cores):
+                # Assigned per row: a list of tuples would broadcast into a 2-D array
+                cols["anchors"][row] = extract_medical_anchors(core.core_text)
+        
+        return cols
+    
+    @staticmethod
+    def _build_exact_lookup(item_names: List[str]) -> Dict[str, int]:
+        """Map exact keys to item positions (first occurrence wins)."""
+        lookup: Dict[str, int] = {}
+        for idx, name in enumerate(item_names):
+            lookup.setdefault(_exact_key(name), idx)
+        return lookup
+    
+    def _exact_item_match(
+        self,
+        item_name: str,
+        item_name_for_matching: str,
+        cat_key: Tuple[str, str],
+        item_index: FAISSIndex,
+        item_objects: np.ndarray,
+    ) -> Optional[ItemMatch]:
+        """
+        Check for an identical tie-up item name before any semantic search.
+        
+        Uses the per-category lookup built at indexing time (O(1) instead of
+        scanning every tie-up item).
+        
+        Returns:
+            ItemMatch with similarity 1.0, or None if no exact match exists
+        """
+        idx = self._item_exact.get(cat_key, {}).get(_exact_key(item_name_for_matching))
+        if idx is None:
+            return None
+        
+        tieup_text = item_index.texts[idx]
+        logger.info(
+            f"Exact match found (fast path): '{item_name}' → '{tieup_text}' (confidence=1.0)"
+        )
+        return ItemMatch(
+            matched_text=tieup_text,
+            similarity=1.0,  # Perfect match
+            index=idx,
+            item=item_objects[idx],
+            normalized_item_name=item_name_for_matching
+        )
+    
+    def _resolve_item_candidates(
+        self,
+        item_name: str,
+        item_name_for_matching: str,
+        item_index: FAISSIndex,
+        item_objects: np.ndarray,
+        results: List[Tuple[int, float]],
+        use_llm: bool,
+    ) -> ItemMatch:
+        """
+        Pick the best top-K semantic candidate (hybrid, partial and LLM checks).
+        
+        Args:
+            item_name: Original item name from the bill
+            item_name_for_matching: Normalized item name used for matching
+            item_index: Item index the candidates came from
+            item_objects: Tie-up items aligned with item_index
+            results: (index, semantic_similarity) candidates from FAISS
+            use_llm: Whether to use LLM for borderline cases
+            
+        Returns:
+            ItemMatch (index -1 means MISMATCH)
+        """
         if not results:
             return ItemMatch(
                 matched_text=None,
@@ -687,7 +1325,7 @@ class SemanticMatcher:
         
         for idx, semantic_sim in results:
             matched_name = item_index.texts[idx]
-            item = item_refs[idx]
+            item = item_objects[idx]
             
             # Calculate hybrid score for this candidate
             hybrid_score, breakdown = calculate_hybrid_score(
@@ -905,7 +1543,16 @@ class SemanticMatcher:
             )
         
         item_index = self._item_indices[cat_key]
-        item_refs = self._item_refs[cat_key]
+        item_cols = self._item_cols[cat_key]
+        item_objects = item_cols["objects"]
+        tieup_cores = item_cols.get("cores")
+        tieup_anchors = item_cols.get("anchors")
+        bill_anchors = None
+        if tieup_anchors is not None:
+            from app.verifier.medical_anchors import extract_medical_anchors
+            
+            # Extracted once, compared against every candidate's precomputed triple
+            bill_anchors = extract_medical_anchors(bill_result.core_text)
         
         # Get embedding
         try:
@@ -958,10 +1605,13 @@ class SemanticMatcher:
         
         for idx, semantic_sim in results:
             matched_name = item_index.texts[idx]
-            item = item_refs[idx]
+            item = item_objects[idx]
             
-            # Extract medical core from candidate
-            tieup_result = extract_medical_core_v2(matched_name)
+            # Medical core of the candidate (precomputed at indexing time)
+            if tieup_cores is not None:
+                tieup_result = tieup_cores[idx]
+            else:
+                tieup_result = extract_medical_core_v2(matched_name)
             
             # LAYER 2: Validate hard constraints
             valid, constraint_reason = validate_hard_constraints(
@@ -1024,7 +1674,9 @@ class SemanticMatcher:
                     'modality': tieup_result.modality,
                     'body_part': tieup_result.body_part,
                 },
-                category=category_name
+                category=category_name,
+                tieup_anchors=tieup_anchors[idx] if tieup_anchors is not None else None,
+                bill_anchors=bill_anchors
             )
             
             logger.debug(f"Candidate '{matched_name}': semantic={semantic_sim:.3f}, hybrid={final_score:.3f}")
@@ -1147,13 +1799,27 @@ class SemanticMatcher:
     
 
     def clear_indices(self):
-        """Clear all FAISS indices and references."""
+        """
+        Clear all FAISS indices and references.
+        
+        Item shards are set aside rather than discarded: the next
+        index_rate_sheets() reuses those whose item names are unchanged
+        instead of re-embedding them.
+        """
+        for cat_key, shard_hash in self._shard_hash.items():
+            if cat_key in self._item_indices:
+                self._retained_shards[cat_key] = (
+                    shard_hash, self._item_indices[cat_key], self._item_exact[cat_key]
+                )
+        
         self._hospital_index = None
         self._hospital_rate_sheets = []
         self._category_indices.clear()
         self._category_refs.clear()
         self._item_indices.clear()
-        self._item_refs.clear()
+        self._item_cols.clear()
+        self._item_exact.clear()
+        self._shard_hash.clear()
         logger.info("All indices cleared")
     
     @property
@@ -13,7 +13,8 @@ Phase-2 Enhancement: Medical anchors contribute 25% to hybrid matching score.
 """
 
 import re
-from typing import Optional, Set, Tuple
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple
 
 
 # =============================================================================
@@ -49,6 +50,55 @@ BODYPART_KEYWORDS = {
 }
 
 
+# =============================================================================
+# Precompiled Patterns
+# =============================================================================
+
+# Dosage patterns stay separate: they are tried in priority order
+# (e.g. "5ml 10mg" must yield "10mg"), which a single alternation would not keep
+DOSAGE_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in DOSAGE_PATTERNS]
+
+# Every dosage pattern starts with a digit: texts without one skip the scan
+DIGIT_REGEX = re.compile(r'\d')
+
+
+def _compile_keyword_alternation(keywords: Set[str]) -> re.Pattern:
+    """Compile a keyword set into one word-bounded alternation (longest first)."""
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+    )
+    return re.compile(r'\b(' + alternation + r')\b')
+
+
+MODALITY_REGEX = _compile_keyword_alternation(MODALITY_KEYWORDS)
+BODYPART_REGEX = _compile_keyword_alternation(BODYPART_KEYWORDS)
+
+
+def _plain_tokens(text_lower: str) -> Optional[List[str]]:
+    """
+    Split text into tokens if every token is purely alphanumeric.
+    
+    For such text, regex word boundaries fall exactly on whitespace, so the
+    first token found in a keyword set is the same hit the regex would return.
+    Returns None when punctuation (e.g. "x-ray", "mri/ct") needs the regex path.
+    """
+    tokens = text_lower.split()
+    return tokens if all(token.isalnum() for token in tokens) else None
+
+
+def _find_keyword(
+    text_lower: str, tokens: Optional[List[str]], keywords: Set[str], regex: re.Pattern
+) -> Optional[str]:
+    """Return the leftmost keyword in text (set probes, regex fallback)."""
+    if tokens is not None:
+        for token in tokens:
+            if token in keywords:
+                return token
+        return None
+    match = regex.search(text_lower)
+    return match.group(1) if match else None
+
+
 # =============================================================================
 # Extraction Functions
 # =============================================================================
@@ -74,8 +124,11 @@ def extract_dosage(text: str) -> Optional[str]:
         >>> extract_dosage("CONSULTATION")
         None
     """
-    for pattern in DOSAGE_PATTERNS:
-        match = re.search(pattern, text, re.IGNORECASE)
+    if not DIGIT_REGEX.search(text):
+        return None
+    
+    for regex in DOSAGE_REGEXES:
+        match = regex.search(text)
         if match:
             # Normalize: remove spaces, convert to lowercase
             dosage = match.group(0).lower().replace(' ', '')
@@ -105,15 +158,9 @@ def extract_modality(text: str) -> Optional[str]:
         >>> extract_modality("CONSULTATION")
         None
     """
-    text_lower = text.lower()
-    
-    # Check for each modality keyword
-    for modality in MODALITY_KEYWORDS:
-        # Use word boundary to avoid partial matches
-        if re.search(r'\b' + re.escape(modality) + r'\b', text_lower):
-            return modality
-    
-    return None
+    # Single pass over all modality keywords (word boundaries avoid partial matches)
+    match = MODALITY_REGEX.search(text.lower())
+    return match.group(1) if match else None
 
 
 def extract_bodypart(text: str) -> Optional[str]:
@@ -136,15 +183,46 @@ def extract_bodypart(text: str) -> Optional[str]:
         >>> extract_bodypart("CONSULTATION")
         None
     """
+    # Single pass over all body part keywords (word boundaries avoid partial matches)
+    match = BODYPART_REGEX.search(text.lower())
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=8192)
+def extract_medical_anchors(text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Extract dosage, modality and body part anchors in one call.
+    
+    Lowercases and tokenizes the text once and runs the scanners over it.
+    Results are memoized: the same tie-up names are scored against every
+    bill item, so most calls are repeats.
+    
+    Args:
+        text: Input text (bill or tie-up item)
+        
+    Returns:
+        Tuple of (dosage, modality, bodypart); each may be None
+        
+    Examples:
+        >>> extract_medical_anchors("MRI BRAIN 5MG")
+        ('5mg', 'mri', 'brain')
+    """
     text_lower = text.lower()
     
-    # Check for each body part keyword
-    for bodypart in BODYPART_KEYWORDS:
-        # Use word boundary to avoid partial matches
-        if re.search(r'\b' + re.escape(bodypart) + r'\b', text_lower):
-            return bodypart
+    dosage = None
+    if DIGIT_REGEX.search(text_lower):
+        for regex in DOSAGE_REGEXES:
+            match = regex.search(text_lower)
+            if match:
+                dosage = match.group(0).replace(' ', '').replace('µg', 'mcg')
+                break
     
-    return None
+    tokens = _plain_tokens(text_lower)
+    return (
+        dosage,
+        _find_keyword(text_lower, tokens, MODALITY_KEYWORDS, MODALITY_REGEX),
+        _find_keyword(text_lower, tokens, BODYPART_KEYWORDS, BODYPART_REGEX),
+    )
 
 
 # =============================================================================
@@ -187,6 +265,43 @@ def calculate_medical_anchor_score(
         >>> breakdown['bodypart_match']
         True
     """
+    return calculate_medical_anchor_score_with_anchors(
+        bill_item, extract_medical_anchors(tieup_item)
+    )
+
+
+def calculate_medical_anchor_score_with_anchors(
+    bill_item: str, tieup_anchors: Tuple[Optional[str], Optional[str], Optional[str]]
+) -> Tuple[float, dict]:
+    """
+    Calculate medical anchor score against precomputed tie-up anchors.
+    
+    Tie-up items are fixed once indexed, so their (dosage, modality, bodypart)
+    triples can be extracted up front; only the bill side is scanned here.
+    
+    Args:
+        bill_item: Normalized bill item text
+        tieup_anchors: (dosage, modality, bodypart) from extract_medical_anchors
+        
+    Returns:
+        Tuple of (score, breakdown_dict), same as calculate_medical_anchor_score
+    """
+    return score_anchor_triples(extract_medical_anchors(bill_item), tieup_anchors)
+
+
+def score_anchor_triples(
+    bill_anchors: Tuple[Optional[str], Optional[str], Optional[str]],
+    tieup_anchors: Tuple[Optional[str], Optional[str], Optional[str]],
+) -> Tuple[float, dict]:
+    """
+    Score two precomputed (dosage, modality, bodypart) triples.
+    
+    Lets candidate loops extract the bill side once and compare it against
+    every tie-up candidate without touching the text again.
+    
+    Returns:
+        Tuple of (score, breakdown_dict), same as calculate_medical_anchor_score
+    """
     breakdown = {
         'dosage_match': False,
         'modality_match': False,
@@ -196,93 +311,23 @@ def calculate_medical_anchor_score(
     
     score = 0.0
     
+    bill_dosage, bill_modality, bill_bodypart = bill_anchors
+    tieup_dosage, tieup_modality, tieup_bodypart = tieup_anchors
+    
     # Dosage match (+0.4)
-    bill_dosage = extract_dosage(bill_item)
-    tieup_dosage = extract_dosage(tieup_item)
     if bill_dosage and tieup_dosage and bill_dosage == tieup_dosage:
         score += 0.4
         breakdown['dosage_match'] = True
     
     # Modality match (+0.3)
-    bill_modality = extract_modality(bill_item)
-    tieup_modality = extract_modality(tieup_item)
     if bill_modality and tieup_modality and bill_modality == tieup_modality:
         score += 0.3
         breakdown['modality_match'] = True
     
     # Body part match (+0.3)
-    bill_bodypart = extract_bodypart(bill_item)
-    tieup_bodypart = extract_bodypart(tieup_item)
     if bill_bodypart and tieup_bodypart and bill_bodypart == tieup_bodypart:
         score += 0.3
         breakdown['bodypart_match'] = True
     
     breakdown['score'] = min(score, 1.0)  # Cap at 1.0
     return breakdown['score'], breakdown
-
-
-# =============================================================================
-# Testing
-# =============================================================================
-
-if __name__ == "__main__":
-    # Test cases
-    test_cases = [
-        # Dosage extraction
-        ("NICORANDIL 5MG", "5mg"),
-        ("PARACETAMOL 500 MG", "500mg"),
-        ("INSULIN 10ML", "10ml"),
-        ("CONSULTATION", None),
-        
-        # Modality extraction
-        ("MRI BRAIN", "mri"),
-        ("CT SCAN ABDOMEN", "ct"),
-        ("X-RAY CHEST", "x-ray"),
-        ("CONSULTATION", None),
-        
-        # Body part extraction
-        ("MRI BRAIN", "brain"),
-        ("CT SCAN ABDOMEN", "abdomen"),
-        ("CARDIAC ECHO", "cardiac"),
-        ("CONSULTATION", None),
-    ]
-    
-    print("Medical Anchor Extraction Test Cases:")
-    print("=" * 80)
-    
-    for text, expected in test_cases[:4]:
-        result = extract_dosage(text)
-        status = "✅" if result == expected else "❌"
-        print(f"{status} Dosage: '{text}' → {result} (expected {expected})")
-    
-    print()
-    
-    for text, expected in test_cases[4:8]:
-        result = extract_modality(text)
-        status = "✅" if result == expected else "❌"
-        print(f"{status} Modality: '{text}' → {result} (expected {expected})")
-    
-    print()
-    
-    for text, expected in test_cases[8:]:
-        result = extract_bodypart(text)
-        status = "✅" if result == expected else "❌"
-        print(f"{status} Body Part: '{text}' → {result} (expected {expected})")
-    
-    print("\n" + "=" * 80)
-    print("Medical Anchor Scoring Test:")
-    print("=" * 80)
-    
-    # Test scoring
-    test_pairs = [
-        ("mri brain 5mg", "mri brain 5mg", 1.0),
-        ("mri brain", "mri brain", 0.6),
-        ("nicorandil 5mg", "nicorandil 5mg", 0.4),
-        ("consultation", "consultation", 0.0),
-    ]
-    
-    for bill, tieup, expected_score in test_pairs:
-        score, breakdown = calculate_medical_anchor_score(bill, tieup)
-        status = "✅" if abs(score - expected_score) < 0.01 else "❌"
-        print(f"{status} '{bill}' vs '{tieup}' → {score:.1f} (expected {expected_score:.1f})")
-        print(f"    Breakdown: {breakdown}")
@@ -23,7 +23,9 @@ This is CRITICAL for matching medicines, implants, and consumables.
 from __future__ import annotations
 
 import re
-from typing import Optional, List
+import string
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 
 # =============================================================================
@@ -100,14 +102,96 @@ MEDICAL_CORE_PATTERNS = [
 ]
 
 
+# Tokens dropped from the extracted core (forms, packaging, visit qualifiers)
+NOISE_WORDS = frozenset({
+    'TABLET', 'CAPSULE', 'INJECTION', 'SYRUP', 'CREAM', 'OINTMENT', 'DROPS',
+    'STRIP', 'BOX', 'PACK', 'BOTTLE', 'VIAL', 'AMPOULE', 'SACHET',
+    'FIRST', 'VISIT', 'FOLLOW', 'UP', 'FOLLOWUP', 'SECOND', 'THIRD',
+    'BRAND', 'MFR', 'MANUFACTURER', 'COMPANY',
+})
+
+
+# =============================================================================
+# Precompiled Patterns
+# =============================================================================
+
+# (anchored, regex) pairs, applied one pattern at a time in list order: an
+# earlier removal can expose or break up a later match (e.g. "2025 STRIP OF 10"
+# must lose "STRIP OF 10" before the "\d+ STRIPS?" pattern sees the text).
+# Patterns anchored with ^ or $ act on whatever the earlier removals leave
+# behind and run on every string.
+INVENTORY_REMOVAL_STEPS = [
+    (pattern.startswith('^') or pattern.endswith('$'), re.compile(pattern, re.IGNORECASE))
+    for pattern in INVENTORY_REMOVAL_PATTERNS
+]
+
+# Every unanchored removal pattern contains one of these literals, so
+# uppercased ASCII text without any of them can skip those passes. Removals
+# only ever insert spaces, so the check on the input holds for every step.
+_INVENTORY_KEYWORDS_RE = re.compile(
+    r'[(\[]|LOT|BATCH|EXP|MFG|MFD|BRAND|MFR|MANUFACTURER'
+    r'|X|STRIP|BOX|PACK|BOTTLE|VIAL|TAB|CAP'
+)
+
+MEDICAL_CORE_REGEXES = [re.compile(p, re.IGNORECASE) for p in MEDICAL_CORE_PATTERNS]
+
+# Linear-time necessary conditions for each core pattern. The lazy name
+# groups backtrack quadratically on long OCR lines when a pattern cannot
+# match; checking for the required strength / form / number token first
+# skips those searches without changing which pattern wins.
+_CORE_STRENGTH_RE = re.compile(r'\d+\.?\d*\s*(?:MG|MCG|UG|GM|G|ML|L|IU|UNITS?)', re.IGNORECASE)
+_CORE_FORM_RE = re.compile(r'TABLET|CAPSULE|INJECTION|SYRUP|CREAM|OINTMENT|DROPS?', re.IGNORECASE)
+_CORE_SPACED_NUMBER_RE = re.compile(r'\s\d')
+MEDICAL_CORE_PREFILTERS = [
+    (_CORE_STRENGTH_RE,),                  # name + strength
+    (_CORE_FORM_RE, _CORE_STRENGTH_RE),    # name + form + strength
+    (_CORE_SPACED_NUMBER_RE,),             # device + size/spec
+    (),                                    # procedure/test name
+]
+
+_STRENGTH_TOKEN_RE = re.compile(r'\d+\.?\d*(?:MG|MCG|GM|ML|IU|UNITS?)', re.IGNORECASE)
+_STRENGTH_RE = re.compile(r'(\d+\.?\d*)\s*(MG|MCG|GM|ML|IU|UNITS?)', re.IGNORECASE)
+_STRENGTH_REMOVAL_RE = re.compile(r'\d+\.?\d*\s*(?:MG|MCG|GM|ML|IU|UNITS?)', re.IGNORECASE)
+_FORM_RE = re.compile(r'\b(TABLET|CAPSULE|INJECTION|SYRUP|CREAM|OINTMENT)\b', re.IGNORECASE)
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# ASCII fast path for the final clean-up: one translate() maps every
+# character _NON_WORD_RE would replace to a space and uppercase to lowercase
+_ASCII_CLEAN_TABLE = str.maketrans({
+    **{chr(c): ' ' for c in range(128) if _NON_WORD_RE.match(chr(c))},
+    **{c: c.lower() for c in string.ascii_uppercase},
+})
+
+# Strength, form, imaging and procedure indicators fused into one alternation
+# so a single case-insensitive scan stops at the first indicator found
+_MEDICAL_INDICATORS_RE = re.compile(
+    r'\d+\s*(?:MG|MCG|GM|ML|IU|UNITS?)'  # Has strength
+    r'|\b(?:TABLET|CAPSULE|INJECTION|SYRUP|CREAM|OINTMENT)\b'  # Has form
+    r'|\b(?:MRI|CT|X-RAY|ULTRASOUND|ECG|ECHO)\b'  # Imaging
+    r'|\b(?:CONSULTATION|PROCEDURE|SURGERY|OPERATION)\b',  # Procedures
+    re.IGNORECASE,
+)
+
+
 # =============================================================================
 # Core Extraction Functions
 # =============================================================================
 
+def _clean_text(text: str) -> str:
+    """Replace special characters with spaces, collapse whitespace, lowercase."""
+    if text.isascii():
+        return ' '.join(text.translate(_ASCII_CLEAN_TABLE).split())
+    return ' '.join(_NON_WORD_RE.sub(' ', text).split()).lower()
+
+
+@lru_cache(maxsize=100_000)
 def extract_medical_core(text: str) -> str:
     """
     Extract medical core from noisy bill item string.
     
+    Results are memoized: bills and rate sheets repeat the same inventory
+    strings, and extraction is a pure function of the text.
+    
     Strategy:
     1. Remove inventory metadata (lot numbers, SKUs, etc.)
     2. Try to match medical core patterns (drug + strength)
@@ -139,16 +223,21 @@ def extract_medical_core(text: str) -> str:
     original = text
     cleaned = text.strip().upper()
     
-    # Step 1: Remove inventory metadata
-    for pattern in INVENTORY_REMOVAL_PATTERNS:
-        cleaned = re.sub(pattern, ' ', cleaned, flags=re.IGNORECASE)
+    # Step 1: Remove inventory metadata (non-ASCII text always takes the full
+    # path since case-insensitive matching folds more than upper() does)
+    has_metadata = not cleaned.isascii() or _INVENTORY_KEYWORDS_RE.search(cleaned)
+    for anchored, regex in INVENTORY_REMOVAL_STEPS:
+        if anchored or has_metadata:
+            cleaned = regex.sub(' ', cleaned)
     
     # Step 2: Try to extract medical core using patterns
     medical_core = None
     
     # Try drug name + strength patterns
-    for pattern in MEDICAL_CORE_PATTERNS:
-        match = re.search(pattern, cleaned, re.IGNORECASE)
+    for prefilters, regex in zip(MEDICAL_CORE_PREFILTERS, MEDICAL_CORE_REGEXES):
+        if not all(prefilter.search(cleaned) for prefilter in prefilters):
+            continue
+        match = regex.search(cleaned)
         if match:
             groups = match.groups()
             # Combine matched groups (drug name + strength)
@@ -161,35 +250,17 @@ def extract_medical_core(text: str) -> str:
     
     # Step 3: Additional cleaning
     # Remove common noise words (MORE COMPREHENSIVE)
-    noise_words = [
-        'TABLET', 'CAPSULE', 'INJECTION', 'SYRUP', 'CREAM', 'OINTMENT', 'DROPS',
-        'STRIP', 'BOX', 'PACK', 'BOTTLE', 'VIAL', 'AMPOULE', 'SACHET',
-        'FIRST', 'VISIT', 'FOLLOW', 'UP', 'FOLLOWUP', 'SECOND', 'THIRD',
-        'BRAND', 'MFR', 'MANUFACTURER', 'COMPANY',
-    ]
-    
-    tokens = medical_core.split()
-    filtered_tokens = []
-    
-    for token in tokens:
-        # Keep if it's a strength indicator
-        if re.match(r'\d+\.?\d*(?:MG|MCG|GM|ML|IU|UNITS?)', token, re.IGNORECASE):
-            filtered_tokens.append(token)
-        # Keep if it's not a noise word
-        elif token not in noise_words and len(token) > 1:
-            filtered_tokens.append(token)
-    
-    medical_core = ' '.join(filtered_tokens)
-    
-    # Step 4: Final normalization
-    # Remove special characters except spaces and numbers
-    medical_core = re.sub(r'[^\w\s]', ' ', medical_core)
-    
-    # Normalize whitespace
-    medical_core = re.sub(r'\s+', ' ', medical_core)
-    
-    # Lowercase
-    medical_core = medical_core.lower().strip()
+    # Keep any non-noise token longer than one char, plus strength
+    # indicators (the set lookup settles most tokens before the regex)
+    is_strength = _STRENGTH_TOKEN_RE.match
+    medical_core = ' '.join([
+        token for token in medical_core.split()
+        if (len(token) > 1 and token not in NOISE_WORDS) or is_strength(token)
+    ])
+    
+    # Step 4: Final normalization (special characters -> spaces, single
+    # spaces, lowercase)
+    medical_core = _clean_text(medical_core)
     
     # Log extraction for debugging
     if medical_core != original.lower().strip():
@@ -199,6 +270,30 @@ def extract_medical_core(text: str) -> str:
     return medical_core
 
 
+def extract_medical_core_batch(texts: Iterable[str]) -> List[str]:
+    """
+    Extract medical cores for many bill items at once.
+    
+    Bills repeat the same inventory strings (one line per dose or day), so
+    each distinct string is extracted once and the result reused.
+    
+    Args:
+        texts: Raw bill item texts
+        
+    Returns:
+        Medical cores in the same order as texts
+    """
+    cores: Dict[str, str] = {}
+    results = []
+    for text in texts:
+        core = cores.get(text)
+        if core is None:
+            core = cores[text] = extract_medical_core(text)
+        results.append(core)
+    return results
+
+
+@lru_cache(maxsize=10_000)
 def extract_strength(text: str) -> Optional[str]:
     """
     Extract strength/dosage from medical text.
@@ -215,8 +310,7 @@ def extract_strength(text: str) -> Optional[str]:
         Strength string or None
     """
     # Match strength patterns
-    strength_pattern = r'(\d+\.?\d*)\s*(MG|MCG|GM|ML|IU|UNITS?)'
-    match = re.search(strength_pattern, text, re.IGNORECASE)
+    match = _STRENGTH_RE.search(text)
     
     if match:
         value = match.group(1)
@@ -226,6 +320,7 @@ def extract_strength(text: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=10_000)
 def extract_drug_name(text: str) -> str:
     """
     Extract drug/procedure name from medical text.
@@ -244,18 +339,16 @@ def extract_drug_name(text: str) -> str:
         Drug/procedure name
     """
     # Remove strength
-    text = re.sub(r'\d+\.?\d*\s*(?:MG|MCG|GM|ML|IU|UNITS?)', '', text, flags=re.IGNORECASE)
+    text = _STRENGTH_REMOVAL_RE.sub('', text)
     
     # Remove form
-    text = re.sub(r'\b(TABLET|CAPSULE|INJECTION|SYRUP|CREAM|OINTMENT)\b', '', text, flags=re.IGNORECASE)
+    text = _FORM_RE.sub('', text)
     
     # Clean and normalize
-    text = re.sub(r'[^\w\s]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.lower().strip()
+    return _clean_text(text)
 
 
+@lru_cache(maxsize=10_000)
 def is_medical_item(text: str) -> bool:
     """
     Check if text appears to be a medical item (vs administrative).
@@ -266,58 +359,5 @@ def is_medical_item(text: str) -> bool:
     Returns:
         True if appears to be medical item
     """
-    text_upper = text.upper()
-    
     # Check for medical indicators
-    medical_indicators = [
-        r'\d+\s*(?:MG|MCG|GM|ML|IU|UNITS?)',  # Has strength
-        r'\b(?:TABLET|CAPSULE|INJECTION|SYRUP|CREAM|OINTMENT)\b',  # Has form
-        r'\b(?:MRI|CT|X-RAY|ULTRASOUND|ECG|ECHO)\b',  # Imaging
-        r'\b(?:CONSULTATION|PROCEDURE|SURGERY|OPERATION)\b',  # Procedures
-    ]
-    
-    for pattern in medical_indicators:
-        if re.search(pattern, text_upper):
-            return True
-    
-    return False
-
-
-# =============================================================================
-# Testing and Validation
-# =============================================================================
-
-if __name__ == "__main__":
-    # Test cases from real medical bills
-    test_cases = [
-        # Medicines with inventory metadata
-        "(30049099) NICORANDIL-TABLET-5MG-KORANDIL- |GTF",
-        "PARACETAMOL 500MG STRIP OF 10 LOT:ABC123",
-        "INSULIN INJECTION 100IU BATCH:XYZ789 EXP:12/2025",
-        "ASPIRIN-TABLET-75MG-DISPRIN- |PHARMA",
-        
-        # Procedures (should work like before)
-        "1. CONSULTATION - FIRST VISIT | Dr. Vivek JaCob P",
-        "MRI BRAIN | Dr. Vivek Jacob Philip",
-        "2) CT Scan - Abdomen",
-        
-        # Implants/consumables
-        "STENT CORONARY (HS:90183100) BRAND:MEDTRONIC",
-        "SUTURE 3-0 VICRYL LOT:ABC123",
-    ]
-    
-    print("Medical Core Extraction Test Cases:")
-    print("=" * 80)
-    
-    for test in test_cases:
-        core = extract_medical_core(test)
-        strength = extract_strength(core)
-        drug_name = extract_drug_name(core)
-        is_medical = is_medical_item(test)
-        
-        print(f"\nOriginal:  '{test}'")
-        print(f"Core:      '{core}'")
-        print(f"Drug Name: '{drug_name}'")
-        print(f"Strength:  '{strength}'")
-        print(f"Medical:   {is_medical}")
-        print("-" * 80)
+    return _MEDICAL_INDICATORS_RE.search(text) is not None
@@ -12,19 +12,33 @@ Phase-3 Principle: One verification, two perspectives
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
 
 from app.verifier.models import FailureReason, VerificationStatus
 
 
+class _Phase3Model(BaseModel):
+    """
+    Base for Phase-3 view models.
+    
+    Views are built once from a finished verification run and never edited,
+    so instances are frozen and unknown fields are rejected. Sequence fields
+    are tuples: lists passed in are stored immutably, and the common empty
+    case shares a single () default instead of allocating a list per field.
+    """
+    
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
 # =============================================================================
 # Debug View Models (Full Trace)
 # =============================================================================
 
 
-class CandidateMatch(BaseModel):
+class CandidateMatch(_Phase3Model):
     """
     A single candidate match attempt.
     
@@ -42,7 +56,7 @@ class CandidateMatch(BaseModel):
     rejection_reason: Optional[str] = None
 
 
-class DebugItemTrace(BaseModel):
+class DebugItemTrace(_Phase3Model):
     """
     Complete trace of a single bill item verification (Debug View).
     
@@ -82,7 +96,7 @@ class DebugItemTrace(BaseModel):
     matched_item: Optional[str] = None  # Only if accepted
     
     # NEW: All candidates tried (full transparency)
-    all_candidates_tried: List[CandidateMatch] = Field(default_factory=list)
+    all_candidates_tried: Tuple[CandidateMatch, ...] = ()
     
     # Pricing
     allowed_rate: Optional[float] = None
@@ -94,17 +108,17 @@ class DebugItemTrace(BaseModel):
     failure_reason: Optional[FailureReason] = None
     
     # Additional context
-    notes: List[str] = Field(default_factory=list)  # e.g., "admin charge", "package-only item"
+    notes: Tuple[str, ...] = ()  # e.g., "admin charge", "package-only item"
     reconciliation_attempted: bool = False
     reconciliation_succeeded: bool = False
-    all_categories_tried: List[str] = Field(default_factory=list)
+    all_categories_tried: Tuple[str, ...] = ()
     
     # NEW: Package-specific information
     is_package_item: bool = False
-    package_components: Optional[List[str]] = None
+    package_components: Optional[Tuple[str, ...]] = None
 
 
-class DebugCategoryTrace(BaseModel):
+class DebugCategoryTrace(_Phase3Model):
     """
     Debug trace for all items in a category.
     
@@ -112,10 +126,10 @@ class DebugCategoryTrace(BaseModel):
     """
     
     category: str
-    items: List[DebugItemTrace] = Field(default_factory=list)
+    items: Tuple[DebugItemTrace, ...] = ()
 
 
-class DebugView(BaseModel):
+class DebugView(_Phase3Model):
     """
     Complete debug view of verification (Developer/Internal).
     
@@ -133,10 +147,12 @@ class DebugView(BaseModel):
     matched_hospital: Optional[str] = None
     hospital_similarity: Optional[float] = None
     
-    categories: List[DebugCategoryTrace] = Field(default_factory=list)
+    categories: Tuple[DebugCategoryTrace, ...] = ()
     
     # Metadata
     total_items_processed: int
+    total_item_count: int  # Line items across all categories
+    grand_total_bill: float  # Sum of all line-item bill amounts
     verification_metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -145,7 +161,7 @@ class DebugView(BaseModel):
 # =============================================================================
 
 
-class FinalItem(BaseModel):
+class FinalItem(_Phase3Model):
     """
     Clean, user-facing item result (Final View).
     
@@ -168,7 +184,7 @@ class FinalItem(BaseModel):
     reason_tag: Optional[FailureReason] = None
 
 
-class FinalCategory(BaseModel):
+class FinalCategory(_Phase3Model):
     """
     Final view for all items in a category.
     
@@ -177,7 +193,7 @@ class FinalCategory(BaseModel):
     """
     
     category: str
-    items: List[FinalItem] = Field(default_factory=list)
+    items: Tuple[FinalItem, ...] = ()
     
     # Category totals
     total_bill: float = 0.0
@@ -185,7 +201,7 @@ class FinalCategory(BaseModel):
     total_extra: float = 0.0
 
 
-class FinalView(BaseModel):
+class FinalView(_Phase3Model):
     """
     Clean, user-facing verification report (Final View).
     
@@ -201,7 +217,7 @@ class FinalView(BaseModel):
     hospital: str
     matched_hospital: Optional[str] = None
     
-    categories: List[FinalCategory] = Field(default_factory=list)
+    categories: Tuple[FinalCategory, ...] = ()
     
     # Grand totals
     grand_total_bill: float = 0.0
@@ -220,7 +236,7 @@ class FinalView(BaseModel):
 # =============================================================================
 
 
-class Phase3Response(BaseModel):
+class Phase3Response(_Phase3Model):
     """
     Complete Phase-3 response with dual views.
     
@@ -235,5 +251,18 @@ class Phase3Response(BaseModel):
     debug_view: DebugView
     final_view: FinalView
     
-    # Validation metadata
-    consistency_check: Dict[str, bool] = Field(default_factory=dict)
+    # Validation metadata (pass/fail flags plus the counts and totals compared)
+    consistency_check: Dict[str, Any] = Field(default_factory=dict)
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the response to UTF-8 JSON bytes.
+        
+        Debug views carry every candidate tried per item, so responses get
+        large; pydantic-core writes them straight to bytes without building
+        an intermediate dict or str.
+        
+        Returns:
+            Same document as model_dump_json(), UTF-8 encoded
+        """
+        return to_json(self)
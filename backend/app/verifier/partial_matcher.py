@@ -17,13 +17,46 @@ Without hardcoding specific item names.
 from __future__ import annotations
 
 import re
-from typing import Set, Tuple
+from functools import lru_cache
+from typing import FrozenSet, Tuple
 
+from app.verifier.medical_anchors import calculate_medical_anchor_score
 
-def extract_core_terms(text: str) -> Set[str]:
+
+# Common medical stop words
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'of', 'for', 'with', 'in', 'on', 'at',
+    'to', 'from', 'by', 'and', 'or', 'but', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
+    'do', 'does', 'did', 'will', 'would', 'should', 'could',
+    'may', 'might', 'must', 'can', 'shall',
+})
+
+# Default weights for calculate_hybrid_score and is_partial_match
+HYBRID_WEIGHTS = {
+    "semantic": 0.6,
+    "token": 0.3,
+    "containment": 0.1,
+}
+
+# Punctuation removed before tokenizing: one translate() deletes every ASCII
+# character that is neither a word character nor whitespace; non-ASCII text
+# falls back to the equivalent regex
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_ASCII_PUNCT_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if _PUNCT_RE.match(chr(c))
+))
+
+
+@lru_cache(maxsize=8192)
+def extract_core_terms(text: str) -> FrozenSet[str]:
     """
     Extract core medical/service terms from text.
     
+    Memoized: overlap and containment scoring re-extract the same bill and
+    tie-up strings for every candidate pair, so the result is a frozenset
+    that can be shared between callers.
+    
     Removes:
     - Common stop words (the, a, an, of, for, with, etc.)
     - Very short words (< 2 chars)
@@ -33,40 +66,43 @@ def extract_core_terms(text: str) -> Set[str]:
         text: Input text (should be normalized)
         
     Returns:
-        Set of core terms
+        Frozen set of core terms
     """
-    # Common medical stop words
-    stop_words = {
-        'the', 'a', 'an', 'of', 'for', 'with', 'in', 'on', 'at',
-        'to', 'from', 'by', 'and', 'or', 'but', 'is', 'are',
-        'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
-        'do', 'does', 'did', 'will', 'would', 'should', 'could',
-        'may', 'might', 'must', 'can', 'shall',
-    }
+    # Remove punctuation, then tokenize and filter
+    text = text.lower()
+    if text.isascii():
+        text = text.translate(_ASCII_PUNCT_TABLE)
+    else:
+        text = _PUNCT_RE.sub('', text)
+    
+    # Keep tokens of 2+ chars that are neither pure numbers nor stop words
+    return frozenset([
+        token for token in text.split()
+        if len(token) >= 2 and not token.isdigit() and token not in STOP_WORDS
+    ])
+
+
+def _overlap_and_containment(
+    terms1: FrozenSet[str],
+    terms2: FrozenSet[str],
+) -> Tuple[float, float]:
+    """
+    Jaccard overlap and containment of terms2 in terms1 from one intersection.
     
-    # Tokenize and filter
-    tokens = text.lower().split()
+    The union size is |terms1| + |terms2| - shared, so no union set is built.
     
-    core_terms = set()
-    for token in tokens:
-        # Remove punctuation
-        token = re.sub(r'[^\w]', '', token)
-        
-        # Skip if too short
-        if len(token) < 2:
-            continue
-        
-        # Skip if pure number
-        if token.isdigit():
-            continue
-        
-        # Skip stop words
-        if token in stop_words:
-            continue
+    Args:
+        terms1: Core terms of the longer text (bill item)
+        terms2: Core terms of the shorter text (tie-up item)
         
-        core_terms.add(token)
+    Returns:
+        Tuple of (token_overlap, containment)
+    """
+    if not terms1 or not terms2:
+        return 0.0, 0.0
     
-    return core_terms
+    shared = len(terms1 & terms2)
+    return shared / (len(terms1) + len(terms2) - shared), shared / len(terms2)
 
 
 def calculate_token_overlap(text1: str, text2: str) -> float:
@@ -82,19 +118,10 @@ def calculate_token_overlap(text1: str, text2: str) -> float:
     Returns:
         Overlap ratio (0.0 to 1.0)
     """
-    terms1 = extract_core_terms(text1)
-    terms2 = extract_core_terms(text2)
-    
-    if not terms1 or not terms2:
-        return 0.0
-    
-    intersection = terms1 & terms2
-    union = terms1 | terms2
-    
-    if not union:
-        return 0.0
-    
-    return len(intersection) / len(union)
+    overlap, _ = _overlap_and_containment(
+        extract_core_terms(text1), extract_core_terms(text2)
+    )
+    return overlap
 
 
 def calculate_containment(text1: str, text2: str) -> float:
@@ -110,15 +137,10 @@ def calculate_containment(text1: str, text2: str) -> float:
     Returns:
         Containment ratio (0.0 to 1.0)
     """
-    terms1 = extract_core_terms(text1)
-    terms2 = extract_core_terms(text2)
-    
-    if not terms2:
-        return 0.0
-    
-    intersection = terms1 & terms2
-    
-    return len(intersection) / len(terms2)
+    _, containment = _overlap_and_containment(
+        extract_core_terms(text1), extract_core_terms(text2)
+    )
+    return containment
 
 
 def calculate_hybrid_score(
@@ -155,15 +177,12 @@ def calculate_hybrid_score(
         (0.78, {...})  # Medium semantic + high containment
     """
     if weights is None:
-        weights = {
-            "semantic": 0.6,
-            "token": 0.3,
-            "containment": 0.1,
-        }
+        weights = dict(HYBRID_WEIGHTS)
     
-    # Calculate all metrics
-    token_overlap = calculate_token_overlap(bill_item, tieup_item)
-    containment = calculate_containment(bill_item, tieup_item)
+    # Calculate all metrics (each side is tokenized once)
+    token_overlap, containment = _overlap_and_containment(
+        extract_core_terms(bill_item), extract_core_terms(tieup_item)
+    )
     
     # Weighted combination
     final_score = (
@@ -228,9 +247,6 @@ def calculate_hybrid_score_v2(
     # Calculate all metrics
     token_overlap = calculate_token_overlap(bill_item, tieup_item)
     
-    # Import medical anchor scoring
-    from app.verifier.medical_anchors import calculate_medical_anchor_score
-    
     medical_anchor_score, medical_breakdown = calculate_medical_anchor_score(
         bill_item, tieup_item
     )
@@ -267,11 +283,15 @@ def is_partial_match(
     
     Strategy (PHASE-1 ENHANCED - Hybrid Scoring):
     1. If semantic similarity >= 0.85: Auto-match (high confidence)
-    2. If semantic similarity >= min_threshold (0.55):
+    2. If the normalized texts are identical: Match (confidence 1.0), even
+       when semantic similarity is below min_threshold. The semantic gate
+       and hybrid score are skipped, so the matcher accepts these without
+       its LLM check for borderline scores.
+    3. If semantic similarity >= min_threshold (0.55):
        a. Calculate hybrid score (weighted: semantic + token + containment)
        b. If hybrid_score >= 0.60: Accept match
        c. Otherwise: Try individual metrics (overlap OR containment)
-    3. Otherwise: Reject
+    4. Otherwise: Reject
     
     PHASE-1 GOAL: Maximize coverage, minimize false negatives.
     False positives are acceptable, false negatives are NOT.
@@ -312,31 +332,37 @@ def is_partial_match(
     if semantic_similarity >= 0.85:
         return True, semantic_similarity, "high_semantic_similarity"
     
+    # Identical normalized text is a match whatever the embedding says, and
+    # needs no tokenization
+    if bill_item and bill_item == tieup_item:
+        return True, 1.0, "identical_text"
+    
     # Reject if semantic similarity too low
     if semantic_similarity < min_semantic_similarity:
         return False, semantic_similarity, "low_semantic_similarity"
     
-    # PHASE-1: Calculate hybrid score (PRIMARY STRATEGY)
-    hybrid_score, breakdown = calculate_hybrid_score(
-        bill_item=bill_item,
-        tieup_item=tieup_item,
-        semantic_similarity=semantic_similarity,
+    # PHASE-1: Calculate hybrid score (PRIMARY STRATEGY), same as
+    # calculate_hybrid_score with default weights but without the breakdown
+    overlap, containment = _overlap_and_containment(
+        extract_core_terms(bill_item), extract_core_terms(tieup_item)
+    )
+    hybrid_score = (
+        HYBRID_WEIGHTS["semantic"] * semantic_similarity +
+        HYBRID_WEIGHTS["token"] * overlap +
+        HYBRID_WEIGHTS["containment"] * containment
     )
     
     # Accept if hybrid score is good (0.60 threshold)
     if hybrid_score >= 0.60:
         reason = (
             f"hybrid_score={hybrid_score:.2f} "
-            f"(sem={breakdown['semantic']:.2f}, "
-            f"tok={breakdown['token_overlap']:.2f}, "
-            f"cont={breakdown['containment']:.2f})"
+            f"(sem={semantic_similarity:.2f}, "
+            f"tok={overlap:.2f}, "
+            f"cont={containment:.2f})"
         )
         return True, hybrid_score, reason
     
     # FALLBACK: Try individual metrics (for edge cases)
-    overlap = breakdown['token_overlap']
-    containment = breakdown['containment']
-    
     # Accept if high overlap (terms are similar)
     if overlap >= overlap_threshold:
         confidence = (semantic_similarity + overlap) / 2
@@ -16,7 +16,8 @@ Phase-2 Principle: Non-destructive aggregation with full traceability
 from __future__ import annotations
 
 import logging
-from typing import List
+from collections import Counter
+from typing import Dict, List
 
 from app.verifier.aggregator import (
     aggregate_line_items,
@@ -24,8 +25,12 @@ from app.verifier.aggregator import (
     resolve_aggregate_status,
 )
 from app.verifier.financial import build_financial_summary
-from app.verifier.models import ItemVerificationResult, VerificationResponse
-from app.verifier.models_v2 import Phase2Response
+from app.verifier.models import (
+    ItemVerificationResult,
+    VerificationResponse,
+    VerificationStatus,
+)
+from app.verifier.models_v2 import AggregatedItem, Phase2Response
 from app.verifier.reconciler import reconcile_categories
 
 logger = logging.getLogger(__name__)
@@ -36,6 +41,16 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+def _count_statuses(items: List[AggregatedItem]) -> Dict[str, int]:
+    """Count GREEN/RED/MISMATCH aggregated items in a single pass."""
+    counts = Counter(item.status for item in items)
+    return {
+        "green": counts[VerificationStatus.GREEN],
+        "red": counts[VerificationStatus.RED],
+        "mismatch": counts[VerificationStatus.MISMATCH],
+    }
+
+
 def process_phase2(
     phase1_response: VerificationResponse, hospital_name: str
 ) -> Phase2Response:
@@ -87,13 +102,7 @@ def process_phase2(
         agg_item.status = resolve_aggregate_status(agg_item.line_items)
     
     # Count statuses before reconciliation
-    pre_reconciliation_stats = {
-        "green": sum(1 for item in aggregated_items if item.status.value == "GREEN"),
-        "red": sum(1 for item in aggregated_items if item.status.value == "RED"),
-        "mismatch": sum(
-            1 for item in aggregated_items if item.status.value == "MISMATCH"
-        ),
-    }
+    pre_reconciliation_stats = _count_statuses(aggregated_items)
     
     logger.info(
         f"Pre-reconciliation: GREEN={pre_reconciliation_stats['green']}, "
@@ -102,21 +111,21 @@ def process_phase2(
     )
     
     # Step 4: Category reconciliation (for MISMATCH items)
-    logger.info("Step 4/5: Attempting category reconciliation...")
-    reconciled_items = reconcile_categories(
-        aggregated_items=aggregated_items,
-        hospital_name=hospital_name,
-        rate_cache=rate_cache,
-    )
-    
-    # Count statuses after reconciliation
-    post_reconciliation_stats = {
-        "green": sum(1 for item in reconciled_items if item.status.value == "GREEN"),
-        "red": sum(1 for item in reconciled_items if item.status.value == "RED"),
-        "mismatch": sum(
-            1 for item in reconciled_items if item.status.value == "MISMATCH"
-        ),
-    }
+    if pre_reconciliation_stats["mismatch"] > 0:
+        logger.info("Step 4/5: Attempting category reconciliation...")
+        reconciled_items = reconcile_categories(
+            aggregated_items=aggregated_items,
+            hospital_name=hospital_name,
+            rate_cache=rate_cache,
+        )
+        
+        # Count statuses after reconciliation
+        post_reconciliation_stats = _count_statuses(reconciled_items)
+    else:
+        # Nothing to reconcile: statuses are unchanged
+        logger.info("Step 4/5: No MISMATCH items, skipping category reconciliation")
+        reconciled_items = aggregated_items
+        post_reconciliation_stats = dict(pre_reconciliation_stats)
     
     logger.info(
         f"Post-reconciliation: GREEN={post_reconciliation_stats['green']}, "
@@ -139,9 +148,11 @@ def process_phase2(
     financial_summary = build_financial_summary(reconciled_items)
     
     # Collect all Phase-1 line items for traceability
-    phase1_line_items: List[ItemVerificationResult] = []
-    for category_result in phase1_response.results:
-        phase1_line_items.extend(category_result.items)
+    phase1_line_items: List[ItemVerificationResult] = [
+        item
+        for category_result in phase1_response.results
+        for item in category_result.items
+    ]
     
     # Build Phase-2 response
     response = Phase2Response(
@@ -11,7 +11,7 @@ Both formatters produce human-readable output suitable for logging and reporting
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import Any, Dict, List
 
 from app.verifier.models import VerificationStatus
 from app.verifier.models_v3 import (
@@ -26,15 +26,24 @@ from app.verifier.models_v3 import (
 
 logger = logging.getLogger(__name__)
 
+# Status markers shared by the debug and final item formatters
+STATUS_EMOJI = {
+    VerificationStatus.GREEN: "✅",
+    VerificationStatus.RED: "❌",
+    VerificationStatus.MISMATCH: "⚠️",
+    VerificationStatus.ALLOWED_NOT_COMPARABLE: "ℹ️",
+    VerificationStatus.IGNORED_ARTIFACT: "⚪",
+}
+
 
 # =============================================================================
 # Debug View Formatter (Verbose)
 # =============================================================================
 
 
-def format_debug_item(item: DebugItemTrace, index: int) -> str:
+def _append_debug_item_lines(item: DebugItemTrace, index: int, lines: List[str]) -> None:
     """
-    Format a single debug item trace.
+    Append the lines of a single debug item trace to ``lines``.
     
     Shows all details including:
     - Original text and normalized form
@@ -44,11 +53,13 @@ def format_debug_item(item: DebugItemTrace, index: int) -> str:
     - Package information (Phase 4-6 enhancement)
     - Notes and diagnostics
     """
-    lines = []
-    lines.append(f"\n  [{index}] {item.original_bill_text}")
-    lines.append(f"      Normalized: {item.normalized_item_name}")
-    lines.append(f"      Bill Amount: ₹{item.bill_amount:.2f}")
-    lines.append(f"      Category: {item.detected_category}")
+    # Fields every trace has, formatted in one go
+    lines.append(
+        f"\n  [{index}] {item.original_bill_text}\n"
+        f"      Normalized: {item.normalized_item_name}\n"
+        f"      Bill Amount: ₹{item.bill_amount:.2f}\n"
+        f"      Category: {item.detected_category}"
+    )
     
     if item.category_attempted != item.detected_category:
         lines.append(f"      Category Attempted: {item.category_attempted} (reconciled)")
@@ -86,15 +97,7 @@ def format_debug_item(item: DebugItemTrace, index: int) -> str:
         lines.append(f"      Allowed Amount: ₹{item.allowed_amount:.2f}")
     
     # Status
-    status_emoji = {
-        VerificationStatus.GREEN: "✅",
-        VerificationStatus.RED: "❌",
-        VerificationStatus.MISMATCH: "⚠️",
-        VerificationStatus.ALLOWED_NOT_COMPARABLE: "ℹ️",
-        VerificationStatus.IGNORED_ARTIFACT: "⚪",
-    }
-    
-    emoji = status_emoji.get(item.final_status, "❓")
+    emoji = STATUS_EMOJI.get(item.final_status, "❓")
     lines.append(f"      Status: {emoji} {item.final_status.value}")
     
     if item.extra_amount > 0:
@@ -118,19 +121,51 @@ def format_debug_item(item: DebugItemTrace, index: int) -> str:
         lines.append(f"      Reconciliation: {status}")
         if item.all_categories_tried:
             lines.append(f"      Categories Tried: {', '.join(item.all_categories_tried)}")
-    
-    return "\n".join(lines)
 
 
-def format_debug_category(category: DebugCategoryTrace) -> str:
-    """Format a complete debug category trace."""
+def format_debug_item(item: DebugItemTrace, index: int) -> str:
+    """Format a single debug item trace."""
     lines = []
+    _append_debug_item_lines(item, index, lines)
+    return "\n".join(lines)
+
+
+def _append_debug_category_lines(category: DebugCategoryTrace, lines: List[str]) -> None:
+    """Append the header and item lines of a debug category trace to ``lines``."""
     lines.append(f"\n{'=' * 80}")
     lines.append(f"CATEGORY: {category.category.upper()}")
     lines.append(f"{'=' * 80}")
     
     for idx, item in enumerate(category.items, 1):
-        lines.append(format_debug_item(item, idx))
+        _append_debug_item_lines(item, idx, lines)
+
+
+def format_debug_category(category: DebugCategoryTrace) -> str:
+    """Format a complete debug category trace."""
+    lines = []
+    _append_debug_category_lines(category, lines)
+    return "\n".join(lines)
+
+
+def format_debug_view(debug_view: DebugView) -> str:
+    """Format the complete debug view as one block of text."""
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append("DEBUG VIEW (Full Trace)")
+    lines.append("=" * 80)
+    lines.append(f"Hospital: {debug_view.hospital}")
+    if debug_view.matched_hospital:
+        lines.append(f"Matched Hospital: {debug_view.matched_hospital} (similarity={debug_view.hospital_similarity:.3f})")
+    lines.append(f"Total Items Processed: {debug_view.total_items_processed}")
+    lines.append("=" * 80)
+    
+    # Every item line goes into this one list and is joined once
+    for category in debug_view.categories:
+        _append_debug_category_lines(category, lines)
+    
+    lines.append("\n" + "=" * 80)
+    lines.append("END DEBUG VIEW")
+    lines.append("=" * 80)
     
     return "\n".join(lines)
 
@@ -139,23 +174,10 @@ def display_debug_view(debug_view: DebugView) -> None:
     """
     Display complete debug view to console.
     
-    Shows full trace with all details for developer inspection.
+    Shows full trace with all details for developer inspection. The view is
+    formatted first and written with a single print call.
     """
-    print("\n" + "=" * 80)
-    print("DEBUG VIEW (Full Trace)")
-    print("=" * 80)
-    print(f"Hospital: {debug_view.hospital}")
-    if debug_view.matched_hospital:
-        print(f"Matched Hospital: {debug_view.matched_hospital} (similarity={debug_view.hospital_similarity:.3f})")
-    print(f"Total Items Processed: {debug_view.total_items_processed}")
-    print("=" * 80)
-    
-    for category in debug_view.categories:
-        print(format_debug_category(category))
-    
-    print("\n" + "=" * 80)
-    print("END DEBUG VIEW")
-    print("=" * 80)
+    print(format_debug_view(debug_view))
 
 
 # =============================================================================
@@ -173,19 +195,10 @@ def format_final_item(item: FinalItem, index: int) -> str:
     - Amounts
     - Reason tag (if MISMATCH)
     """
-    status_emoji = {
-        VerificationStatus.GREEN: "✅",
-        VerificationStatus.RED: "❌",
-        VerificationStatus.MISMATCH: "⚠️",
-        VerificationStatus.ALLOWED_NOT_COMPARABLE: "ℹ️",
-        VerificationStatus.IGNORED_ARTIFACT: "⚪",
-    }
-    
-    emoji = status_emoji.get(item.final_status, "❓")
+    emoji = STATUS_EMOJI.get(item.final_status, "❓")
     
     # Basic line
-    line = f"  {index}. {emoji} {item.display_name}"
-    line += f" | Bill: ₹{item.bill_amount:.2f}"
+    line = f"  {index}. {emoji} {item.display_name} | Bill: ₹{item.bill_amount:.2f}"
     
     if item.final_status == VerificationStatus.GREEN:
         line += f" | Allowed: ₹{item.allowed_amount:.2f}"
@@ -220,41 +233,50 @@ def format_final_category(category: FinalCategory) -> str:
     return "\n".join(lines)
 
 
-def display_final_view(final_view: FinalView) -> None:
-    """
-    Display clean final view to console.
-    
-    Shows user-friendly report with essential information only.
-    """
-    print("\n" + "=" * 80)
-    print("FINAL VIEW (User Report)")
-    print("=" * 80)
-    print(f"Hospital: {final_view.hospital}")
+def format_final_view(final_view: FinalView) -> str:
+    """Format the complete final view as one block of text."""
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append("FINAL VIEW (User Report)")
+    lines.append("=" * 80)
+    lines.append(f"Hospital: {final_view.hospital}")
     if final_view.matched_hospital:
-        print(f"Matched Hospital: {final_view.matched_hospital}")
-    print("=" * 80)
+        lines.append(f"Matched Hospital: {final_view.matched_hospital}")
+    lines.append("=" * 80)
     
     for category in final_view.categories:
-        print(format_final_category(category))
+        lines.append(format_final_category(category))
     
     # Grand totals
-    print("\n" + "=" * 80)
-    print("GRAND TOTALS")
-    print("=" * 80)
-    print(f"  Total Bill: ₹{final_view.grand_total_bill:.2f}")
-    print(f"  Total Allowed: ₹{final_view.grand_total_allowed:.2f}")
+    lines.append("\n" + "=" * 80)
+    lines.append("GRAND TOTALS")
+    lines.append("=" * 80)
+    lines.append(f"  Total Bill: ₹{final_view.grand_total_bill:.2f}")
+    lines.append(f"  Total Allowed: ₹{final_view.grand_total_allowed:.2f}")
     if final_view.grand_total_extra > 0:
-        print(f"  Total Extra: ₹{final_view.grand_total_extra:.2f}")
+        lines.append(f"  Total Extra: ₹{final_view.grand_total_extra:.2f}")
+    
+    lines.append(f"\n  Status Summary:")
+    lines.append(f"    ✅ GREEN: {final_view.green_count}")
+    lines.append(f"    ❌ RED: {final_view.red_count}")
+    lines.append(f"    ⚠️ MISMATCH: {final_view.mismatch_count}")
+    lines.append(f"    ℹ️ ALLOWED_NOT_COMPARABLE: {final_view.allowed_not_comparable_count}")
     
-    print(f"\n  Status Summary:")
-    print(f"    ✅ GREEN: {final_view.green_count}")
-    print(f"    ❌ RED: {final_view.red_count}")
-    print(f"    ⚠️ MISMATCH: {final_view.mismatch_count}")
-    print(f"    ℹ️ ALLOWED_NOT_COMPARABLE: {final_view.allowed_not_comparable_count}")
+    lines.append("\n" + "=" * 80)
+    lines.append("END FINAL VIEW")
+    lines.append("=" * 80)
+    
+    return "\n".join(lines)
+
+
+def display_final_view(final_view: FinalView) -> None:
+    """
+    Display clean final view to console.
     
-    print("\n" + "=" * 80)
-    print("END FINAL VIEW")
-    print("=" * 80)
+    Shows user-friendly report with essential information only. The view is
+    formatted first and written with a single print call.
+    """
+    print(format_final_view(final_view))
 
 
 # =============================================================================
@@ -262,29 +284,45 @@ def display_final_view(final_view: FinalView) -> None:
 # =============================================================================
 
 
+def format_consistency_check(consistency_check: Dict[str, Any]) -> str:
+    """Format the consistency check flags and counts."""
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append("CONSISTENCY CHECK")
+    lines.append("=" * 80)
+    for key, value in consistency_check.items():
+        emoji = "✅" if value is True else "❌" if value is False else "ℹ️"
+        lines.append(f"  {emoji} {key}: {value}")
+    lines.append("=" * 80)
+    
+    return "\n".join(lines)
+
+
 def display_phase3_response(phase3_response: Phase3Response, view: str = "both") -> None:
     """
     Display Phase-3 response.
     
+    All requested sections are formatted into one buffer and written with a
+    single print call, so long traces don't pay per-line stdout overhead.
+    
     Args:
         phase3_response: Complete Phase-3 response
         view: Which view to display ("debug", "final", or "both")
     """
+    sections = []
+    
     if view in ["debug", "both"]:
-        display_debug_view(phase3_response.debug_view)
+        sections.append(format_debug_view(phase3_response.debug_view))
     
     if view in ["final", "both"]:
-        display_final_view(phase3_response.final_view)
+        sections.append(format_final_view(phase3_response.final_view))
     
     # Show consistency check
     if phase3_response.consistency_check:
-        print("\n" + "=" * 80)
-        print("CONSISTENCY CHECK")
-        print("=" * 80)
-        for key, value in phase3_response.consistency_check.items():
-            emoji = "✅" if value is True else "❌" if value is False else "ℹ️"
-            print(f"  {emoji} {key}: {value}")
-        print("=" * 80)
+        sections.append(format_consistency_check(phase3_response.consistency_check))
+    
+    if sections:
+        print("\n".join(sections))
 
 
 # =============================================================================
@@ -14,6 +14,8 @@ Phase 4-6 Enhancement: Explicit failure reasoning and candidate tracking
 from __future__ import annotations
 
 import logging
+import re
+from collections import Counter
 from typing import List
 
 from app.verifier.models import VerificationStatus
@@ -33,6 +35,13 @@ from app.verifier.artifact_detector import is_artifact
 
 logger = logging.getLogger(__name__)
 
+# Bill items naming a package, bundle, combo or plan (case-insensitive)
+_PACKAGE_KEYWORDS_RE = re.compile(r"package|bundle|combo|plan", re.IGNORECASE)
+
+# Matching strategy indexed by how many similarity thresholds (0.85, 0.95)
+# a matched item clears; Phase-2 uses hybrid v2 below both
+_MATCHING_STRATEGIES = ("hybrid_v2", "fuzzy", "exact")
+
 
 # =============================================================================
 # Debug View Builder
@@ -56,80 +65,83 @@ def build_debug_view(phase2_response: Phase2Response) -> DebugView:
     Returns:
         Debug view with full trace
     """
-    debug_categories = []
-    
     # Group items by category (preserve original order within category)
     category_map = {}
+    total_item_count = 0
+    grand_total_bill = 0.0
     for agg_item in phase2_response.aggregated_items:
-        if agg_item.category not in category_map:
-            category_map[agg_item.category] = []
+        # Per-aggregate values are invariant across its line items
+        category = agg_item.category
+        detected_category = agg_item.original_category or category
+        reconciliation_note = agg_item.reconciliation_note
+        reconciliation_attempted = agg_item.original_category is not None
+        allowed_per_unit = agg_item.allowed_per_unit
+        add_trace = category_map.setdefault(category, []).append
         
         # Create debug trace for each line item
         for line_item in agg_item.line_items:
-            # Determine matching strategy
-            matching_strategy = "none"
-            if line_item.matched_item:
-                if line_item.similarity_score and line_item.similarity_score >= 0.95:
-                    matching_strategy = "exact"
-                elif line_item.similarity_score and line_item.similarity_score >= 0.85:
-                    matching_strategy = "fuzzy"
-                else:
-                    matching_strategy = "hybrid_v2"  # Phase-2 uses hybrid v2
+            diag = line_item.diagnostics
+            matched = line_item.matched_item
+            sim = line_item.similarity_score
+            
+            # Determine matching strategy (a missing score counts as hybrid v2)
+            if matched:
+                score = sim or 0.0
+                matching_strategy = _MATCHING_STRATEGIES[(score >= 0.85) + (score >= 0.95)]
+            else:
+                matching_strategy = "none"
             
             # Build notes
             notes = []
-            if agg_item.reconciliation_note:
-                notes.append(agg_item.reconciliation_note)
+            if reconciliation_note:
+                notes.append(reconciliation_note)
             
             # Get all categories tried
             all_categories_tried = (
-                line_item.diagnostics.all_categories_tried
-                if line_item.diagnostics
-                else [agg_item.category]
+                diag.all_categories_tried
+                if diag
+                else [category]
             )
+            best_cand = diag.best_candidate if diag else None
+            best_sim = diag.best_candidate_similarity if diag else None
             
             # Phase 4-6: Build all_candidates_tried list
             all_candidates_tried = []
             
             # Add best candidate if exists
-            if line_item.diagnostics and line_item.diagnostics.best_candidate:
+            if best_cand:
+                was_accepted = matched == best_cand
                 all_candidates_tried.append(
                     CandidateMatch(
-                        candidate_name=line_item.diagnostics.best_candidate,
-                        similarity_score=line_item.diagnostics.best_candidate_similarity or 0.0,
-                        category=agg_item.category,
-                        was_accepted=line_item.matched_item == line_item.diagnostics.best_candidate,
+                        candidate_name=best_cand,
+                        similarity_score=best_sim or 0.0,
+                        category=category,
+                        was_accepted=was_accepted,
                         rejection_reason=(
-                            None if line_item.matched_item == line_item.diagnostics.best_candidate
-                            else f"Below threshold (similarity={line_item.diagnostics.best_candidate_similarity:.3f})"
+                            None if was_accepted
+                            else f"Below threshold (similarity={best_sim:.3f})"
                         )
                     )
                 )
             
             # Phase 4-6: Determine if package item
             # Check if item name contains package/bundle keywords
-            item_lower = line_item.bill_item.lower()
-            is_package = any(
-                keyword in item_lower
-                for keyword in ["package", "bundle", "combo", "plan"]
-            )
+            bill_text = line_item.bill_item
+            normalized_name = line_item.normalized_item_name or bill_text
+            is_package = _PACKAGE_KEYWORDS_RE.search(bill_text) is not None
             
             # Phase 4-6: Detect if administrative/artifact
-            is_admin = is_artifact(line_item.bill_item)
+            is_admin = is_artifact(bill_text)
             
             # Phase 4-6: Enhanced failure reason determination
             failure_reason = None
             if line_item.status == VerificationStatus.MISMATCH:
-                best_similarity = (
-                    line_item.diagnostics.best_candidate_similarity
-                    if line_item.diagnostics
-                    else 0.0
-                )
+                best_similarity = best_sim if diag else 0.0
                 
                 failure_reason = determine_failure_reason(
-                    item_name=line_item.bill_item,
-                    normalized_name=line_item.normalized_item_name or line_item.bill_item,
-                    category=agg_item.category,
+                    item_name=bill_text,
+                    normalized_name=normalized_name,
+                    category=category,
                     best_similarity=best_similarity,
                     all_categories_tried=all_categories_tried,
                     is_package=is_package,
@@ -138,54 +150,48 @@ def build_debug_view(phase2_response: Phase2Response) -> DebugView:
                 
                 # Add failure reason to notes
                 notes.append(f"Failure reason: {failure_reason.value}")
-            elif line_item.diagnostics and line_item.diagnostics.failure_reason:
+            elif diag and diag.failure_reason:
                 # Use existing failure reason if available
-                failure_reason = line_item.diagnostics.failure_reason
+                failure_reason = diag.failure_reason
             
             # Create debug trace
             debug_trace = DebugItemTrace(
-                original_bill_text=line_item.bill_item,
-                normalized_item_name=line_item.normalized_item_name or line_item.bill_item,
+                original_bill_text=bill_text,
+                normalized_item_name=normalized_name,
                 bill_amount=line_item.bill_amount,
-                detected_category=agg_item.original_category or agg_item.category,
-                category_attempted=agg_item.category,
+                detected_category=detected_category,
+                category_attempted=category,
                 matching_strategy=matching_strategy,
-                semantic_similarity=line_item.similarity_score,
+                semantic_similarity=sim,
                 token_overlap=None,  # Would need to extract from diagnostics
                 medical_anchor_score=None,  # Would need to extract from diagnostics
-                hybrid_score=line_item.similarity_score,
-                best_candidate=(
-                    line_item.diagnostics.best_candidate
-                    if line_item.diagnostics
-                    else None
-                ),
-                best_candidate_similarity=(
-                    line_item.diagnostics.best_candidate_similarity
-                    if line_item.diagnostics
-                    else None
-                ),
-                matched_item=line_item.matched_item,
+                hybrid_score=sim,
+                best_candidate=best_cand,
+                best_candidate_similarity=best_sim,
+                matched_item=matched,
                 all_candidates_tried=all_candidates_tried,  # Phase 4-6: NEW
-                allowed_rate=agg_item.allowed_per_unit if line_item.matched_item else None,
+                allowed_rate=allowed_per_unit if matched else None,
                 allowed_amount=line_item.allowed_amount,
                 extra_amount=line_item.extra_amount,
                 final_status=line_item.status,
                 failure_reason=failure_reason,  # Phase 4-6: Enhanced
                 notes=notes,
-                reconciliation_attempted=agg_item.original_category is not None,
-                reconciliation_succeeded=agg_item.reconciliation_note is not None,
+                reconciliation_attempted=reconciliation_attempted,
+                reconciliation_succeeded=reconciliation_note is not None,
                 all_categories_tried=all_categories_tried,
                 is_package_item=is_package,  # Phase 4-6: NEW
                 package_components=None,  # Phase 4-6: NEW (would need package data)
             )
             
-            category_map[agg_item.category].append(debug_trace)
+            add_trace(debug_trace)
+            total_item_count += 1
+            grand_total_bill += line_item.bill_amount
     
     # Build category traces
-    for category, items in category_map.items():
-        debug_categories.append(
-            DebugCategoryTrace(category=category, items=items)
-        )
+    debug_categories = [
+        DebugCategoryTrace(category=category, items=items)
+        for category, items in category_map.items()
+    ]
     
     return DebugView(
         hospital=phase2_response.hospital,
@@ -193,6 +199,8 @@ def build_debug_view(phase2_response: Phase2Response) -> DebugView:
         hospital_similarity=phase2_response.hospital_similarity,
         categories=debug_categories,
         total_items_processed=len(phase2_response.phase1_line_items),
+        total_item_count=total_item_count,
+        grand_total_bill=grand_total_bill,
         verification_metadata=phase2_response.processing_metadata,
     )
 
@@ -224,10 +232,7 @@ def build_final_view(debug_view: DebugView) -> FinalView:
     grand_total_allowed = 0.0
     grand_total_extra = 0.0
     
-    green_count = 0
-    red_count = 0
-    mismatch_count = 0
-    allowed_not_comparable_count = 0
+    status_counts = Counter()
     
     for debug_category in debug_view.categories:
         final_items = []
@@ -259,16 +264,9 @@ def build_final_view(debug_view: DebugView) -> FinalView:
             category_total_bill += debug_item.bill_amount
             category_total_allowed += debug_item.allowed_amount
             category_total_extra += debug_item.extra_amount
-            
-            # Update counts
-            if debug_item.final_status == VerificationStatus.GREEN:
-                green_count += 1
-            elif debug_item.final_status == VerificationStatus.RED:
-                red_count += 1
-            elif debug_item.final_status == VerificationStatus.MISMATCH:
-                mismatch_count += 1
-            elif debug_item.final_status == VerificationStatus.ALLOWED_NOT_COMPARABLE:
-                allowed_not_comparable_count += 1
+        
+        # Update counts
+        status_counts.update(item.final_status for item in final_items)
         
         final_categories.append(
             FinalCategory(
@@ -292,10 +290,10 @@ def build_final_view(debug_view: DebugView) -> FinalView:
         grand_total_bill=grand_total_bill,
         grand_total_allowed=grand_total_allowed,
         grand_total_extra=grand_total_extra,
-        green_count=green_count,
-        red_count=red_count,
-        mismatch_count=mismatch_count,
-        allowed_not_comparable_count=allowed_not_comparable_count,
+        green_count=status_counts[VerificationStatus.GREEN],
+        red_count=status_counts[VerificationStatus.RED],
+        mismatch_count=status_counts[VerificationStatus.MISMATCH],
+        allowed_not_comparable_count=status_counts[VerificationStatus.ALLOWED_NOT_COMPARABLE],
     )
 
 
@@ -323,8 +321,8 @@ def validate_consistency(debug_view: DebugView, final_view: FinalView) -> dict:
     """
     checks = {}
     
-    # Count items in both views
-    debug_item_count = sum(len(cat.items) for cat in debug_view.categories)
+    # Count items in both views (debug totals are accumulated while building)
+    debug_item_count = debug_view.total_item_count
     final_item_count = sum(len(cat.items) for cat in final_view.categories)
     
     checks["item_count_match"] = debug_item_count == final_item_count
@@ -332,11 +330,7 @@ def validate_consistency(debug_view: DebugView, final_view: FinalView) -> dict:
     checks["final_item_count"] = final_item_count
     
     # Verify totals match
-    debug_total_bill = sum(
-        item.bill_amount
-        for cat in debug_view.categories
-        for item in cat.items
-    )
+    debug_total_bill = debug_view.grand_total_bill
     
     checks["totals_match"] = abs(debug_total_bill - final_view.grand_total_bill) < 0.01
     checks["debug_total_bill"] = debug_total_bill
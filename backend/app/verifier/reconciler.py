@@ -17,6 +17,7 @@ categorized differently in the bill vs. tie-up rate sheet.
 from __future__ import annotations
 
 import logging
+import os
 from typing import Dict, List, Optional, Tuple
 
 from app.verifier.matcher import ITEM_SIMILARITY_THRESHOLD, get_matcher
@@ -25,16 +26,46 @@ from app.verifier.models_v2 import AggregatedItem
 
 logger = logging.getLogger(__name__)
 
+# Stop trying further categories once a match is at least this similar
+RECONCILIATION_EARLY_EXIT_SIMILARITY = float(
+    os.getenv("RECONCILIATION_EARLY_EXIT_SIMILARITY", "0.98")
+)
+
 
 # =============================================================================
 # Alternative Category Matching
 # =============================================================================
 
 
+def _get_hospital_categories(matcher, hospital_name: str) -> Optional[List[str]]:
+    """
+    Get all category names from the hospital's tie-up rate sheet.
+    
+    Args:
+        matcher: Semantic matcher holding the indexed rate sheets
+        hospital_name: Hospital name for matching
+        
+    Returns:
+        Category names in rate-sheet order, or None if no rate sheet matched
+    """
+    try:
+        # Get the rate sheet for this hospital
+        hospital_match = matcher.match_hospital(hospital_name)
+        if not hospital_match.is_match or hospital_match.rate_sheet is None:
+            logger.warning(f"No rate sheet found for hospital: {hospital_name}")
+            return None
+        
+        return [cat.category_name for cat in hospital_match.rate_sheet.categories]
+    except Exception as e:
+        logger.error(f"Error getting categories: {e}")
+        return None
+
+
 def try_alternative_categories(
     item: AggregatedItem,
     hospital_name: str,
     rate_cache: Dict[Tuple[str, str], float],
+    all_categories: Optional[List[str]] = None,
 ) -> Optional[dict]:
     """
     Try matching item in all available categories.
@@ -46,6 +77,8 @@ def try_alternative_categories(
         item: Aggregated item to reconcile
         hospital_name: Hospital name for matching
         rate_cache: Rate cache for pricing
+        all_categories: Pre-resolved rate-sheet categories (looked up from
+            the hospital's rate sheet when omitted)
         
     Returns:
         Best match result dict or None
@@ -62,22 +95,14 @@ def try_alternative_categories(
     best_score = 0.0
     
     # Get all available categories from rate sheets
-    # Note: This requires adding a method to matcher to get all categories
-    # For now, we'll try to get categories from the rate sheet
-    try:
-        # Get the rate sheet for this hospital
-        hospital_match = matcher.match_hospital(hospital_name)
-        if not hospital_match.is_match or hospital_match.rate_sheet is None:
-            logger.warning(f"No rate sheet found for hospital: {hospital_name}")
+    if all_categories is None:
+        all_categories = _get_hospital_categories(matcher, hospital_name)
+        if all_categories is None:
             return None
-        
-        rate_sheet = hospital_match.rate_sheet
-        all_categories = [cat.category_name for cat in rate_sheet.categories]
-    except Exception as e:
-        logger.error(f"Error getting categories: {e}")
-        return None
     
     attempted_categories = [item.category]
+    # Categories tried up to and including the current best match
+    best_attempted_count = 0
     
     for category in all_categories:
         if category == item.category:
@@ -99,14 +124,19 @@ def try_alternative_categories(
                     "matched_item": match_result.matched_text,
                     "category": category,
                     "similarity": match_result.similarity,
-                    "attempted_categories": attempted_categories.copy(),
                 }
                 best_score = match_result.similarity
+                best_attempted_count = len(attempted_categories)
+                
+                # A near-perfect match cannot be meaningfully improved on
+                if best_score >= RECONCILIATION_EARLY_EXIT_SIMILARITY:
+                    break
         except Exception as e:
             logger.debug(f"Error matching in category {category}: {e}")
             continue
     
     if best_match:
+        best_match["attempted_categories"] = attempted_categories[:best_attempted_count]
         logger.info(
             f"Reconciliation success: '{item.normalized_name}' "
             f"found in '{best_match['category']}' (similarity={best_score:.2f})"
@@ -150,14 +180,22 @@ def reconcile_categories(
     """
     reconciled_items = []
     reconciliation_stats = {"attempted": 0, "succeeded": 0, "failed": 0}
+    # Rate-sheet categories, looked up once on the first MISMATCH item
+    hospital_categories = None
     
     for agg_item in aggregated_items:
         if agg_item.status == VerificationStatus.MISMATCH:
             reconciliation_stats["attempted"] += 1
             
+            if hospital_categories is None:
+                hospital_categories = _get_hospital_categories(get_matcher(), hospital_name) or []
+            
             # Try alternative categories
             best_match = try_alternative_categories(
-                item=agg_item, hospital_name=hospital_name, rate_cache=rate_cache
+                item=agg_item,
+                hospital_name=hospital_name,
+                rate_cache=rate_cache,
+                all_categories=hospital_categories,
             )
             
             if best_match:
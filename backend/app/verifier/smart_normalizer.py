@@ -28,6 +28,10 @@ class TokenImportance(str, Enum):
 @dataclass
 class WeightedToken:
     """Token with importance weight."""
+    # Slots instead of a per-instance __dict__ (explicit, as
+    # dataclass(slots=True) needs Python 3.10)
+    __slots__ = ("text", "importance", "original_position")
+    
     text: str
     importance: TokenImportance
     original_position: int
@@ -72,6 +76,28 @@ LOW_IMPORTANCE_TERMS = {
     'strip', 'box', 'pack', 'bottle',
 }
 
+# Importance of every listed term, filled lowest level first so a term in
+# several sets (e.g. 'consultation') keeps its highest level
+TOKEN_IMPORTANCE = {
+    term: importance
+    for terms, importance in (
+        (LOW_IMPORTANCE_TERMS, TokenImportance.LOW),
+        (MEDIUM_IMPORTANCE_TERMS, TokenImportance.MEDIUM),
+        (HIGH_IMPORTANCE_QUALIFIERS, TokenImportance.HIGH),
+        (CRITICAL_MEDICAL_TERMS, TokenImportance.CRITICAL),
+    )
+    for term in terms
+}
+
+# Ordering of importance levels for minimum-importance filtering
+IMPORTANCE_LEVELS = {
+    TokenImportance.CRITICAL: 4,
+    TokenImportance.HIGH: 3,
+    TokenImportance.MEDIUM: 2,
+    TokenImportance.LOW: 1,
+    TokenImportance.NOISE: 0,
+}
+
 # Noise (always remove)
 NOISE_PATTERNS = [
     r'\(\d{4,}\)',  # SKU codes
@@ -80,6 +106,13 @@ NOISE_PATTERNS = [
     r'\|[A-Z]{2,}\s*$',  # Brand suffixes
 ]
 
+# Compiled once at import; classify_token_importance runs for every token
+NOISE_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in NOISE_PATTERNS]
+# Characters a noise match can start with; other tokens skip NOISE_REGEXES
+_NOISE_FIRST_CHARS = frozenset('(LlBb|')
+_DOSAGE_TOKEN_RE = re.compile(r'\d+\.?\d*(mg|mcg|ml|g|iu|units?)')
+_TOKEN_RE = re.compile(r'[\w-]+')
+
 
 def classify_token_importance(token: str, position: int, context: str) -> TokenImportance:
     """
@@ -96,29 +129,19 @@ def classify_token_importance(token: str, position: int, context: str) -> TokenI
     token_lower = token.lower()
     
     # Check if it's noise
-    for pattern in NOISE_PATTERNS:
-        if re.match(pattern, token, re.IGNORECASE):
-            return TokenImportance.NOISE
-    
-    # Check if it's a dosage (HIGH importance)
-    if re.match(r'\d+\.?\d*(mg|mcg|ml|g|iu|units?)', token_lower):
-        return TokenImportance.HIGH
+    if token[:1] in _NOISE_FIRST_CHARS:
+        for regex in NOISE_REGEXES:
+            if regex.match(token):
+                return TokenImportance.NOISE
     
-    # Check critical medical terms
-    if token_lower in CRITICAL_MEDICAL_TERMS:
-        return TokenImportance.CRITICAL
-    
-    # Check high importance qualifiers
-    if token_lower in HIGH_IMPORTANCE_QUALIFIERS:
+    # Check if it's a dosage (HIGH importance); dosages start with a digit
+    if token_lower[:1].isdigit() and _DOSAGE_TOKEN_RE.match(token_lower):
         return TokenImportance.HIGH
     
-    # Check medium importance
-    if token_lower in MEDIUM_IMPORTANCE_TERMS:
-        return TokenImportance.MEDIUM
-    
-    # Check low importance
-    if token_lower in LOW_IMPORTANCE_TERMS:
-        return TokenImportance.LOW
+    # Check known critical/high/medium/low terms in one lookup
+    importance = TOKEN_IMPORTANCE.get(token_lower)
+    if importance is not None:
+        return importance
     
     # Default: If it's a long word (likely medical term), mark as CRITICAL
     if len(token) >= 5 and token.isalpha():
@@ -128,12 +151,16 @@ def classify_token_importance(token: str, position: int, context: str) -> TokenI
     return TokenImportance.MEDIUM
 
 
-def tokenize_with_weights(text: str) -> List[WeightedToken]:
+def tokenize_with_weights(
+    text: str,
+    min_importance: TokenImportance = TokenImportance.LOW,
+) -> List[WeightedToken]:
     """
     Tokenize text and assign importance weights.
     
     Args:
         text: Input text
+        min_importance: Minimum importance level to keep (noise is always dropped)
         
     Returns:
         List of WeightedToken objects
@@ -143,19 +170,19 @@ def tokenize_with_weights(text: str) -> List[WeightedToken]:
         >>> [(t.text, t.importance.value) for t in tokens]
         [('consultation', 'CRITICAL'), ('first', 'HIGH'), ('visit', 'MEDIUM')]
     """
-    # Clean and tokenize
-    cleaned = re.sub(r'[^\w\s-]', ' ', text)
-    tokens = cleaned.split()
+    min_level = IMPORTANCE_LEVELS[min_importance]
     
+    # Tokens are runs of word characters and hyphens; anything else separates
     weighted_tokens = []
-    for i, token in enumerate(tokens):
+    for i, match in enumerate(_TOKEN_RE.finditer(text)):
+        token = match.group()
         if len(token) < 2:  # Skip very short tokens
             continue
             
         importance = classify_token_importance(token, i, text)
         
-        # Skip noise tokens
-        if importance == TokenImportance.NOISE:
+        # Skip noise tokens and anything below the requested level
+        if importance == TokenImportance.NOISE or IMPORTANCE_LEVELS[importance] < min_level:
             continue
         
         weighted_tokens.append(WeightedToken(
@@ -190,27 +217,11 @@ def normalize_with_weights(
         >>> normalize_with_weights("(30049099) NICORANDIL-5MG |GTF")
         ('nicorandil 5mg', [WeightedToken(...), ...])
     """
-    # Get weighted tokens
-    tokens = tokenize_with_weights(text)
-    
-    # Filter by importance
-    importance_order = {
-        TokenImportance.CRITICAL: 4,
-        TokenImportance.HIGH: 3,
-        TokenImportance.MEDIUM: 2,
-        TokenImportance.LOW: 1,
-        TokenImportance.NOISE: 0,
-    }
-    
-    min_level = importance_order[min_importance]
-    
-    filtered_tokens = [
-        t for t in tokens
-        if importance_order[t.importance] >= min_level
-    ]
+    # Get weighted tokens, filtered by importance while tokenizing
+    filtered_tokens = tokenize_with_weights(text, min_importance)
     
     # Build normalized text
-    normalized = ' '.join(t.text for t in filtered_tokens)
+    normalized = ' '.join([t.text for t in filtered_tokens])
     
     return normalized, filtered_tokens
 
@@ -8,6 +8,7 @@ Handles common OCR artifacts like numbering, doctor names, separators, etc.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 # =============================================================================
@@ -45,15 +46,67 @@ SPLIT_PATTERNS = [
     r"\s+\|\s+Dr", # Pipe before doctor
 ]
 
+# PHASE-1: Non-medical artifact patterns (matched against upper-cased text)
+NON_MEDICAL_PATTERNS = [
+    r'^\d+$',  # Pure numbers (e.g., "123456789")
+    r'^[A-Z0-9]{10,}$',  # Long alphanumeric codes (e.g., "ABC123XYZ456")
+    r'\bLOT[:\s]*[A-Z0-9\-]+',  # Lot numbers
+    r'\bBATCH[:\s]*[A-Z0-9\-]+',  # Batch codes
+    r'\bEXP[:\s]*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # Expiry dates
+    r'\bSKU[:\s]*[A-Z0-9\-]+',  # SKU codes
+    r'^\s*$',  # Whitespace only
+    r'^[\W_]+$',  # Only special characters
+    r'^\(\d+\)$',  # Just a code in parentheses
+]
+
+# PHASE-1: Administrative charge patterns (searched in lower-cased text)
+ADMIN_PATTERNS = [
+    r'\b(registration|admission|processing|file)\s+(fee|charge)s?\b',
+    r'\b(hospital|facility|service)\s+(fee|charge)s?\b',
+    r'\badmin(istrative)?\s+(fee|charge)s?\b',
+    r'\bdeposit\b',
+    r'\badvance\s+payment\b',
+    r'\bmiscellaneous\s+(fee|charge)s?\b',
+    r'\bconveyance\s+(fee|charge)s?\b',
+    r'\bdocument(ation)?\s+(fee|charge)s?\b',
+    r'\brecord\s+(fee|charge)s?\b',
+    r'\bcertificate\s+(fee|charge)s?\b',
+]
+
+# Compiled once at import so every bill line skips re's pattern-cache lookup
+SPLIT_REGEXES = [re.compile(pattern) for pattern in SPLIT_PATTERNS]
+REMOVAL_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in REMOVAL_PATTERNS]
+NON_MEDICAL_REGEXES = [re.compile(pattern) for pattern in NON_MEDICAL_PATTERNS]
+ADMIN_REGEXES = [re.compile(pattern) for pattern in ADMIN_PATTERNS]
+
+# All split / removal patterns fused into one alternation each. If the fused
+# search finds nothing, every individual split or sub would be a no-op, so
+# the ordered passes only run for text that has something to remove.
+_SPLIT_ANY_RE = re.compile("|".join(f"(?:{p})" for p in SPLIT_PATTERNS))
+_REMOVAL_ANY_RE = re.compile(
+    "|".join(f"(?:{p})" for p in REMOVAL_PATTERNS), re.IGNORECASE
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s/\-]")
+_NUMBERING_PREFIX_RE = re.compile(r"^\s*\d+[\.\)]\s*")
+_ONLY_SPECIAL_CHARS_RE = re.compile(r"^[\W_]+$")
+_DIGIT_RE = re.compile(r"\d")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
 
 # =============================================================================
 # Normalization Functions
 # =============================================================================
 
+@lru_cache(maxsize=8192)
 def normalize_bill_item_text(text: str) -> str:
     """
     Normalize bill item text for matching.
     
+    Results are memoized: the same line items recur across bills and
+    normalization is a pure function of the text.
+    
     Removes common OCR artifacts:
     - Numbering prefixes (1., 2), a., etc.)
     - Doctor names and credentials
@@ -83,28 +136,31 @@ def normalize_bill_item_text(text: str) -> str:
     normalized = text.strip()
     
     # Step 1: Split on common separators (take first part only)
-    for pattern in SPLIT_PATTERNS:
-        parts = re.split(pattern, normalized, maxsplit=1)
-        if len(parts) > 1:
-            normalized = parts[0].strip()
-            break
-    
-    # Step 2: Remove unwanted patterns
-    for pattern in REMOVAL_PATTERNS:
-        normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+    if _SPLIT_ANY_RE.search(normalized):
+        for regex in SPLIT_REGEXES:
+            parts = regex.split(normalized, maxsplit=1)
+            if len(parts) > 1:
+                normalized = parts[0].strip()
+                break
+    
+    # Step 2: Remove unwanted patterns (in order: the anchored ones act on
+    # whatever earlier removals leave behind)
+    if _REMOVAL_ANY_RE.search(normalized):
+        for regex in REMOVAL_REGEXES:
+            normalized = regex.sub("", normalized)
     
     # Step 3: Normalize whitespace
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
     
     # Step 4: Remove special characters (keep alphanumeric and spaces)
     # But preserve common medical abbreviations like "/"
-    normalized = re.sub(r"[^\w\s/\-]", " ", normalized)
+    normalized = _SPECIAL_CHARS_RE.sub(" ", normalized)
     
     # Step 5: Normalize to lowercase
     normalized = normalized.lower().strip()
     
     # Step 6: Remove extra whitespace again
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
     
     return normalized
 
@@ -127,10 +183,10 @@ def normalize_category_name(text: str) -> str:
     normalized = text.strip()
     
     # Remove numbering
-    normalized = re.sub(r"^\s*\d+[\.\)]\s*", "", normalized)
+    normalized = _NUMBERING_PREFIX_RE.sub("", normalized)
     
     # Normalize whitespace
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
     
     # Lowercase
     normalized = normalized.lower().strip()
@@ -167,7 +223,7 @@ def should_skip_category(category_name: str) -> bool:
         return True
     
     # Skip if only special characters
-    if re.match(r"^[\W_]+$", normalized):
+    if _ONLY_SPECIAL_CHARS_RE.match(normalized):
         return True
     
     return False
@@ -209,21 +265,8 @@ def is_non_medical_artifact(text: str) -> bool:
     if len(text_upper) < 2:
         return True
     
-    # PHASE-1: Non-medical artifact patterns
-    NON_MEDICAL_PATTERNS = [
-        r'^\d+$',  # Pure numbers (e.g., "123456789")
-        r'^[A-Z0-9]{10,}$',  # Long alphanumeric codes (e.g., "ABC123XYZ456")
-        r'\bLOT[:\s]*[A-Z0-9\-]+',  # Lot numbers
-        r'\bBATCH[:\s]*[A-Z0-9\-]+',  # Batch codes
-        r'\bEXP[:\s]*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # Expiry dates
-        r'\bSKU[:\s]*[A-Z0-9\-]+',  # SKU codes
-        r'^\s*$',  # Whitespace only
-        r'^[\W_]+$',  # Only special characters
-        r'^\(\d+\)$',  # Just a code in parentheses
-    ]
-    
-    for pattern in NON_MEDICAL_PATTERNS:
-        if re.match(pattern, text_upper):
+    for regex in NON_MEDICAL_REGEXES:
+        if regex.match(text_upper):
             return True
     
     return False
@@ -257,22 +300,8 @@ def is_administrative_charge(text: str) -> bool:
     
     text_lower = text.strip().lower()
     
-    # PHASE-1: Administrative charge patterns
-    ADMIN_PATTERNS = [
-        r'\b(registration|admission|processing|file)\s+(fee|charge)s?\b',
-        r'\b(hospital|facility|service)\s+(fee|charge)s?\b',
-        r'\badmin(istrative)?\s+(fee|charge)s?\b',
-        r'\bdeposit\b',
-        r'\badvance\s+payment\b',
-        r'\bmiscellaneous\s+(fee|charge)s?\b',
-        r'\bconveyance\s+(fee|charge)s?\b',
-        r'\bdocument(ation)?\s+(fee|charge)s?\b',
-        r'\brecord\s+(fee|charge)s?\b',
-        r'\bcertificate\s+(fee|charge)s?\b',
-    ]
-    
-    for pattern in ADMIN_PATTERNS:
-        if re.search(pattern, text_lower):
+    for regex in ADMIN_REGEXES:
+        if regex.search(text_lower):
             return True
     
     return False
@@ -323,8 +352,8 @@ def validate_normalization(original: str, normalized: str) -> dict:
         "normalized_length": len(normalized),
         "removed_chars": len(original) - len(normalized),
         "is_empty": len(normalized) == 0,
-        "has_numbers": bool(re.search(r"\d", normalized)),
-        "has_special_chars": bool(re.search(r"[^\w\s]", normalized)),
+        "has_numbers": bool(_DIGIT_RE.search(normalized)),
+        "has_special_chars": bool(_NON_WORD_RE.search(normalized)),
     }
 
 
@@ -26,6 +26,7 @@ from typing import Any, Dict, List, Optional
 from app.verifier.matcher import (
     CATEGORY_SIMILARITY_THRESHOLD,
     ITEM_SIMILARITY_THRESHOLD,
+    ItemMatch,
     SemanticMatcher,
     get_matcher,
 )
@@ -385,11 +386,29 @@ class BillVerifier:
         
         # PHASE-1: ALWAYS process items (regardless of category confidence)
         # This maximizes coverage and minimizes false negatives
+        from app.verifier.text_normalizer import is_administrative_charge
+        
+        # Match all comparable items of the category in one batched call
+        # (administrative charges never reach the matcher)
+        items_to_match = [
+            bill_item for bill_item in bill_category.items
+            if not is_administrative_charge(bill_item.item_name)
+        ]
+        item_matches = {}
+        if items_to_match and category_match.matched_text:
+            batch = self.matcher.match_items_batch(
+                item_names=[bill_item.item_name for bill_item in items_to_match],
+                hospital_name=hospital_name,
+                category_name=category_match.matched_text,
+            )
+            item_matches = {id(bill_item): m for bill_item, m in zip(items_to_match, batch)}
+        
         for bill_item in bill_category.items:
             item_result = self._verify_item(
                 bill_item=bill_item,
                 hospital_name=hospital_name,
                 category_name=category_match.matched_text,
+                item_match=item_matches.get(id(bill_item)),
             )
             result.items.append(item_result)
         
@@ -400,6 +419,7 @@ class BillVerifier:
         bill_item: BillItem,
         hospital_name: str,
         category_name: str,
+        item_match: Optional[ItemMatch] = None,
     ) -> ItemVerificationResult:
         """
         Verify a single item.
@@ -413,14 +433,17 @@ class BillVerifier:
             bill_item: Item from the bill
             hospital_name: Matched hospital name
             category_name: Matched category name
+            item_match: Precomputed match from match_items_batch (the caller has
+                already ruled out administrative charges); matched on demand if None
             
         Returns:
             ItemVerificationResult (NEVER None)
         """
         # PHASE-1: Check if this is an administrative charge FIRST
+        # (skipped for precomputed matches, which are never administrative)
         from app.verifier.text_normalizer import is_administrative_charge
         
-        if is_administrative_charge(bill_item.item_name):
+        if item_match is None and is_administrative_charge(bill_item.item_name):
             # Administrative charges cannot be compared against tie-up rates
             from app.verifier.models import FailureReason, MismatchDiagnostics, VerificationStatus
             
@@ -448,12 +471,13 @@ class BillVerifier:
         
         # Match item (V2: Enhanced 6-layer matching architecture)
         # Falls back to V1 automatically if V2 modules not available
-        item_match = self.matcher.match_item_v2(
-            item_name=bill_item.item_name,
-            hospital_name=hospital_name,
-            category_name=category_name,
-            threshold=None,  # Use category-specific threshold
-        )
+        if item_match is None:
+            item_match = self.matcher.match_item_v2(
+                item_name=bill_item.item_name,
+                hospital_name=hospital_name,
+                category_name=category_name,
+                threshold=None,  # Use category-specific threshold
+            )
         
         # Check price if match found
         if item_match.is_match and item_match.item is not None:
@@ -0,0 +1,36 @@
+"""Tests for OCR/administrative artifact detection."""
+
+import pytest
+
+from app.verifier.artifact_detector import filter_artifacts, is_artifact
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Page 1 of 2", True),
+    ("Ph: +91-9876543210", True),
+    ("info@hospital.com", True),
+    ("Bill No: 12345", True),
+    ("Date: 01/01/2024", True),
+    ("--", True),
+    ("", True),
+    ("MRI BRAIN", False),
+    ("NICORANDIL 5MG", False),
+    ("Blood Test - CBC", False),
+])
+def test_is_artifact(text, expected):
+    assert is_artifact(text) is expected
+
+
+def test_is_artifact_is_memoized():
+    is_artifact.cache_clear()
+    
+    assert is_artifact("SYRINGE 5ML") is False
+    assert is_artifact("SYRINGE 5ML") is False
+    
+    info = is_artifact.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_filter_artifacts_keeps_medical_items():
+    items = ["MRI BRAIN", "Page 1 of 2", "CONSULTATION", "www.hospital.com"]
+    assert filter_artifacts(items) == ["MRI BRAIN", "CONSULTATION"]
@@ -0,0 +1,70 @@
+"""Tests for the matrix-backed persistent embedding cache."""
+
+import json
+
+import numpy as np
+
+import app.verifier.embedding_cache as embedding_cache_module
+from app.verifier.embedding_cache import EmbeddingCache
+from app.verifier.embedding_service import EmbeddingService
+
+
+def _vector(*values):
+    return np.array(values, dtype=np.float32)
+
+
+def test_get_matrix_gathers_rows_in_text_order(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.json"))
+    cache.set_batch({"mri brain": _vector(1, 0), "ct scan": _vector(0, 1)})
+    
+    embeddings, missing = cache.get_matrix(["CT Scan ", "x-ray", "mri brain"])
+    
+    assert missing == [1]
+    assert embeddings.dtype == np.float32
+    assert np.array_equal(embeddings, [[0, 1], [0, 0], [1, 0]])
+
+
+def test_get_matrix_on_empty_cache(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.json"))
+    
+    assert cache.get_matrix(["mri brain", "ct scan"]) == (None, [0, 1])
+
+
+def test_cache_grows_and_round_trips_through_json(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_cache_module, "_INITIAL_CAPACITY", 2)
+    path = tmp_path / "cache.json"
+    cache = EmbeddingCache(str(path))
+    
+    for i in range(5):
+        cache.set(f"item {i}", _vector(i, -i))
+    cache.set("item 0", _vector(7, 7))
+    assert cache.save()
+    
+    stored = json.loads(path.read_text())
+    assert len(stored) == 5
+    assert sorted(stored.values()) == [[1.0, -1.0], [2.0, -2.0], [3.0, -3.0], [4.0, -4.0], [7.0, 7.0]]
+    
+    reloaded = EmbeddingCache(str(path))
+    assert reloaded.size == 5
+    assert np.array_equal(reloaded.get("item 0"), [7, 7])
+    assert np.array_equal(reloaded.get("item 4"), [4, -4])
+
+
+def test_get_embeddings_only_generates_uncached_rows(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "cache.json"))
+    cache.set("mri brain", _vector(1, 0))
+    service = EmbeddingService(cache=cache)
+    
+    generated_batches = []
+    
+    def fake_generate(texts):
+        generated_batches.append(texts)
+        return np.array([[0, len(text)] for text in texts], dtype=np.float32), None
+    
+    service._generate_embeddings = fake_generate
+    
+    embeddings = service.get_embeddings(["ct scan", "mri brain", "x-ray"])
+    
+    assert generated_batches == [["ct scan", "x-ray"]]
+    assert np.array_equal(embeddings, [[0, 7], [1, 0], [0, 5]])
+    assert cache.contains("x-ray")
@@ -0,0 +1,27 @@
+"""Tests for failure reason descriptions."""
+
+from app.verifier.failure_reasons import get_failure_reason_description
+from app.verifier.models import FailureReason
+
+
+def test_description_for_enum_member():
+    assert (
+        get_failure_reason_description(FailureReason.NOT_IN_TIEUP)
+        == "Item not found in tie-up rate sheet"
+    )
+
+
+def test_description_for_string_value():
+    assert (
+        get_failure_reason_description("CATEGORY_CONFLICT")
+        == "Item found in different category"
+    )
+
+
+def test_description_for_unknown_value():
+    assert get_failure_reason_description("NOT_A_REASON") == "Unknown failure reason"
+
+
+def test_every_reason_has_description():
+    for reason in FailureReason:
+        assert get_failure_reason_description(reason) != "Unknown failure reason"
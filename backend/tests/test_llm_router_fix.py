@@ -10,7 +10,7 @@ from pathlib import Path
 backend_path = Path(__file__).parent / "backend"
 sys.path.insert(0, str(backend_path))
 
-from app.verifier.llm_router import LLMRouter, LLMMatchResult
+from app.verifier.llm_router import LLMDecisionCache, LLMRouter, LLMMatchResult
 
 def test_llm_router_method_exists():
     """Verify that match_with_llm method exists and has correct signature."""
@@ -74,6 +74,21 @@ def test_llm_auto_reject():
     
     print("✅ Auto-reject works correctly for low similarity")
 
+def test_llm_decision_cache_keys():
+    """Cache lookups are case-insensitive and keyed on the ordered pair."""
+    cache = LLMDecisionCache()
+    result = LLMMatchResult(
+        match=True, confidence=0.8, normalized_name="mri brain", model_used="phi3:mini"
+    )
+    cache.set("MRI Brain", "mri brain plain", result)
+    
+    assert cache.get("mri brain", "MRI BRAIN PLAIN") is result
+    assert cache.get("mri brain plain", "mri brain") is None
+    assert cache.get("mri brain", "ct brain") is None
+    assert cache.size == 1
+    
+    print("✅ LLM decision cache keys work correctly")
+
 if __name__ == "__main__":
     print("=" * 60)
     print("VALIDATION TEST: LLM Router Fix")
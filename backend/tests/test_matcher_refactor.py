@@ -10,7 +10,22 @@ from pathlib import Path
 backend_dir = Path(__file__).parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
+import hashlib
+
+import faiss
+import numpy as np
+import pytest
+
+from app.verifier.embedding_service import EmbeddingServiceUnavailable
+import app.verifier.matcher as matcher_module
+from app.verifier.matcher import (
+    HNSW_EF_SEARCH,
+    HNSW_MIN_INDEX_SIZE,
+    FAISSIndex,
+    SemanticMatcher,
+)
 from app.verifier.medical_core_extractor import extract_medical_core
+from app.verifier.models import TieUpCategory, TieUpItem, TieUpRateSheet
 from app.verifier.partial_matcher import is_partial_match
 
 
@@ -156,6 +171,415 @@ def test_combined_pipeline():
     print()
 
 
+# =============================================================================
+# SemanticMatcher with a stubbed embedding service
+# =============================================================================
+
+class StubEmbeddingService:
+    """Deterministic bag-of-words embeddings; counts calls, can simulate outages."""
+    
+    dimension = 64
+    
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batch_calls = []
+        self.single_calls = []
+    
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for token in text.lower().split():
+            digest = hashlib.md5(token.encode("utf-8")).digest()
+            vector[digest[0] % self.dimension] += 1.0
+        return vector
+    
+    def get_embedding(self, text):
+        self.single_calls.append(text)
+        if self.fail:
+            raise EmbeddingServiceUnavailable("Embedding service unavailable: stub down")
+        return self._embed(text)
+    
+    def get_embeddings_safe(self, texts):
+        self.batch_calls.append(list(texts))
+        if self.fail:
+            return None, "Embedding service unavailable: stub down"
+        return np.stack([self._embed(t) for t in texts]), None
+    
+    def save_cache(self):
+        pass
+
+
+class StubLLMRouter:
+    cache_size = 0
+    cache_hit_rate = 0.0
+
+
+def _rate_sheet() -> TieUpRateSheet:
+    return TieUpRateSheet(
+        hospital_name="Test Hospital",
+        categories=[
+            TieUpCategory(
+                category_name="Radiology",
+                items=[
+                    TieUpItem(item_name="CT Brain", rate=2000),
+                    TieUpItem(item_name="MRI Brain", rate=5000),
+                    TieUpItem(item_name="X-Ray Chest", rate=300),
+                ],
+            ),
+            TieUpCategory(
+                category_name="Consultation",
+                items=[
+                    TieUpItem(item_name="Consultation", rate=500),
+                    TieUpItem(item_name="MRI Brain", rate=5000),
+                ],
+            ),
+        ],
+    )
+
+
+def _matcher(service: StubEmbeddingService) -> SemanticMatcher:
+    matcher = SemanticMatcher(embedding_service=service, llm_router=StubLLMRouter(), persist_indices=False)
+    assert matcher.index_rate_sheets([_rate_sheet()])
+    return matcher
+
+
+def _assert_same_matches(batch, single):
+    assert len(batch) == len(single)
+    for b, s in zip(batch, single):
+        assert b.matched_text == s.matched_text
+        assert b.index == s.index
+        assert b.item == s.item
+        assert b.normalized_item_name == s.normalized_item_name
+        assert b.error == s.error
+        assert b.similarity == pytest.approx(s.similarity, abs=1e-5)
+
+
+def test_index_rate_sheets_embeds_once_and_deduplicates():
+    service = StubEmbeddingService()
+    matcher = _matcher(service)
+    
+    assert len(service.batch_calls) == 1
+    texts = service.batch_calls[0]
+    assert len(texts) == len(set(texts))
+    assert texts.count("MRI Brain") == 1
+    
+    def assert_rows(index, names):
+        assert index.texts == names
+        for row, name in enumerate(names):
+            expected = service._embed(name)
+            expected /= np.linalg.norm(expected)
+            # Vectors are stored fp16-quantized by default
+            assert np.allclose(index.index.reconstruct(row), expected, atol=1e-3)
+    
+    assert_rows(matcher._hospital_index, ["Test Hospital"])
+    assert_rows(matcher._category_indices["test hospital"], ["Radiology", "Consultation"])
+    assert_rows(
+        matcher._item_indices[("test hospital", "radiology")],
+        ["CT Brain", "MRI Brain", "X-Ray Chest"],
+    )
+    assert_rows(
+        matcher._item_indices[("test hospital", "consultation")],
+        ["Consultation", "MRI Brain"],
+    )
+
+
+def test_item_columns_align_with_index_rows():
+    matcher = _matcher(StubEmbeddingService())
+    cat_key = ("test hospital", "radiology")
+    cols = matcher._item_cols[cat_key]
+    
+    assert list(cols["names"]) == matcher._item_indices[cat_key].texts
+    assert cols["rates"].tolist() == [2000.0, 5000.0, 300.0]
+    assert [item.item_name for item in cols["objects"]] == list(cols["names"])
+
+
+def test_v2_tieup_anchors_precomputed(monkeypatch):
+    monkeypatch.setattr(matcher_module, "USE_V2_MATCHING", True)
+    matcher = _matcher(StubEmbeddingService())
+    cat_key = ("test hospital", "radiology")
+    cols = matcher._item_cols[cat_key]
+    
+    assert cols["anchors"][1] == (None, "mri", "brain")
+    assert [core.core_text for core in cols["cores"]] == [
+        matcher_module.extract_medical_core_v2(name).core_text for name in cols["names"]
+    ]
+    
+    precomputed = matcher.match_item_v2("MRI Brain Plain", "Test Hospital", "Radiology", use_llm=False)
+    del cols["cores"], cols["anchors"]
+    recomputed = matcher.match_item_v2("MRI Brain Plain", "Test Hospital", "Radiology", use_llm=False)
+    _assert_same_matches([precomputed], [recomputed])
+
+
+def test_index_rate_sheets_fails_as_a_whole():
+    matcher = SemanticMatcher(
+        embedding_service=StubEmbeddingService(fail=True), llm_router=StubLLMRouter(), persist_indices=False
+    )
+    
+    assert matcher.index_rate_sheets([_rate_sheet()]) is False
+    assert "stub down" in matcher.indexing_error
+    assert matcher._item_indices == {}
+
+
+def test_faiss_index_selection():
+    large = FAISSIndex(16, expected_size=HNSW_MIN_INDEX_SIZE + 1)
+    assert isinstance(large.index, faiss.IndexHNSWFlat)
+    assert large.index.hnsw.efSearch == HNSW_EF_SEARCH
+    assert large.index.metric_type == faiss.METRIC_INNER_PRODUCT
+    
+    tuned = FAISSIndex(16, expected_size=HNSW_MIN_INDEX_SIZE + 1, ef_search=48)
+    assert tuned.index.hnsw.efSearch == 48
+    
+    small = FAISSIndex(16, expected_size=HNSW_MIN_INDEX_SIZE).index
+    assert isinstance(small, faiss.IndexScalarQuantizer)
+    assert small.metric_type == faiss.METRIC_INNER_PRODUCT
+    assert isinstance(FAISSIndex(16).index, faiss.IndexScalarQuantizer)
+
+
+def test_faiss_ivf_index_tier(monkeypatch, tmp_path):
+    monkeypatch.setattr(matcher_module, "IVF_MIN_INDEX_SIZE", 256)
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((400, 16)).astype(np.float32)
+    texts = [f"item {i}" for i in range(400)]
+    
+    assert FAISSIndex(16, expected_size=255).nprobe is None
+    index = FAISSIndex(16, expected_size=400)
+    assert isinstance(index.index, faiss.IndexIVFFlat)
+    assert index.index.nlist == 20
+    assert index.nprobe == 1
+    
+    index.add(vectors.copy(), texts)
+    index.nprobe = 1000  # clamped to nlist: exhaustive search
+    assert index.nprobe == 20
+    assert [index.search_best(v)[0] for v in vectors[:10]] == list(range(10))
+    
+    index.save(tmp_path / "ivf")
+    loaded = FAISSIndex.load(tmp_path / "ivf")
+    assert loaded.nprobe == 20
+    assert loaded.search(vectors[3], k=2)[0][0] == 3
+
+
+@pytest.mark.parametrize("quantizer, index_type, tolerance", [
+    ("fp16", faiss.IndexScalarQuantizer, 1e-3),
+    ("8bit", faiss.IndexScalarQuantizer, 1e-2),
+    ("none", faiss.IndexFlatIP, 1e-6),
+])
+def test_faiss_index_scalar_quantizer(monkeypatch, quantizer, index_type, tolerance):
+    monkeypatch.setattr(matcher_module, "SCALAR_QUANTIZER", quantizer)
+    service = StubEmbeddingService()
+    names = ["CT Brain", "MRI Brain", "X-Ray Chest", "Consultation"]
+    index = FAISSIndex(service.dimension)
+    assert isinstance(index.index, index_type)
+    index.add(np.stack([service._embed(n) for n in names]), names)
+    
+    for name in names:
+        idx, similarity = index.search_best(service._embed(name))
+        assert index.texts[idx] == name
+        assert similarity == pytest.approx(1.0, abs=tolerance)
+
+
+def test_semantic_matcher_ef_search_reaches_item_indices():
+    items = [TieUpItem(item_name=f"Lab test {i}", rate=100) for i in range(HNSW_MIN_INDEX_SIZE + 1)]
+    rate_sheet = TieUpRateSheet(
+        hospital_name="Test Hospital",
+        categories=[TieUpCategory(category_name="Laboratory", items=items)],
+    )
+    matcher = SemanticMatcher(
+        embedding_service=StubEmbeddingService(), llm_router=StubLLMRouter(), persist_indices=False, ef_search=40
+    )
+    assert matcher.index_rate_sheets([rate_sheet])
+    
+    item_index = matcher._item_indices[("test hospital", "laboratory")].index
+    assert isinstance(item_index, faiss.IndexHNSWFlat)
+    assert item_index.hnsw.efSearch == 40
+
+
+def test_faiss_index_search_drops_missing_labels():
+    index = FAISSIndex(StubEmbeddingService.dimension)
+    service = StubEmbeddingService()
+    index.add(np.stack([service._embed("ct brain"), service._embed("mri brain")]), ["CT Brain", "MRI Brain"])
+    
+    # Simulate HNSW padding the result with a -1 label
+    class PaddedIndex:
+        ntotal = 2
+        
+        def search(self, queries, k):
+            n = len(queries)
+            return (
+                np.array([[0.9, -3.4e38]] * n, dtype=np.float32),
+                np.array([[1, -1]] * n, dtype=np.int64),
+            )
+    
+    index.index = PaddedIndex()
+    query = service._embed("mri brain")
+    
+    assert index.search(query, k=2) == [(1, pytest.approx(0.9))]
+    assert index.search_batch(np.stack([query, query]), k=2) == [
+        [(1, pytest.approx(0.9))],
+        [(1, pytest.approx(0.9))],
+    ]
+
+
+def test_faiss_index_search_best_matches_search():
+    service = StubEmbeddingService()
+    names = ["CT Brain", "MRI Brain", "X-Ray Chest"]
+    index = FAISSIndex(service.dimension)
+    index.add(np.stack([service._embed(n) for n in names]), names)
+    
+    for text in ["mri brain plain", "chest x-ray", "ct brain"]:
+        query = service._embed(text).astype(np.float64)  # exercises the float32 cast
+        idx, similarity = index.search_best(query)
+        expected_idx, expected_similarity = index.search(query, k=1)[0]
+        assert idx == expected_idx
+        assert similarity == pytest.approx(expected_similarity)
+    
+    assert FAISSIndex(service.dimension).search_best(service._embed("ct brain")) is None
+
+
+def test_query_normalization_skipped_for_normalized_service():
+    service = StubEmbeddingService()
+    assert _matcher(service)._item_indices[("test hospital", "radiology")].normalize_queries
+    
+    service.returns_normalized = True
+    matcher = _matcher(service)
+    item_index = matcher._item_indices[("test hospital", "radiology")]
+    assert not item_index.normalize_queries
+    
+    query = service._embed("mri brain plain")
+    query /= np.linalg.norm(query)
+    idx, similarity = item_index.search_best(query)
+    assert item_index.texts[idx] == "MRI Brain"
+    assert similarity == pytest.approx(item_index.search(query, k=1)[0][1])
+
+
+
+BATCH_ITEMS = [
+    "CT Brain",                     # exact fast path
+    "MRI BRAIN | Dr. Vivek",        # exact after normalization
+    "CT scan of brain plain",       # semantic path
+    "X-Ray Chest PA view",          # semantic path
+    "Dental cleaning",              # semantic path, likely mismatch
+]
+
+
+def test_match_items_batch_matches_per_item_loop():
+    service = StubEmbeddingService()
+    matcher = _matcher(service)
+    
+    single = [
+        matcher.match_item(name, "Test Hospital", "Radiology", use_llm=False)
+        for name in BATCH_ITEMS
+    ]
+    service.batch_calls.clear()
+    service.single_calls.clear()
+    
+    batch = matcher.match_items_batch(BATCH_ITEMS, "Test Hospital", "Radiology", use_llm=False)
+    
+    _assert_same_matches(batch, single)
+    assert batch[0].similarity == 1.0 and batch[1].similarity == 1.0
+    # Only the non-exact queries are embedded, all in a single call
+    assert len(service.batch_calls) == 1
+    assert len(service.batch_calls[0]) == 3
+    assert service.single_calls == []
+
+
+def test_match_items_batch_embedding_failure():
+    matcher = _matcher(StubEmbeddingService())
+    matcher.embedding_service = StubEmbeddingService(fail=True)
+    
+    single = [
+        matcher.match_item(name, "Test Hospital", "Radiology", use_llm=False)
+        for name in BATCH_ITEMS
+    ]
+    batch = matcher.match_items_batch(BATCH_ITEMS, "Test Hospital", "Radiology", use_llm=False)
+    
+    _assert_same_matches(batch, single)
+    assert batch[0].is_match
+    assert all(m.has_error for m in batch[2:])
+
+
+def test_index_rate_sheets_reuses_saved_indices(tmp_path):
+    def build(service, rate_sheet):
+        matcher = SemanticMatcher(
+            embedding_service=service, llm_router=StubLLMRouter(), index_cache_dir=str(tmp_path)
+        )
+        assert matcher.index_rate_sheets([rate_sheet])
+        return matcher
+    
+    first_service = StubEmbeddingService()
+    first = build(first_service, _rate_sheet())
+    assert len(first_service.batch_calls) == 1
+    
+    second_service = StubEmbeddingService()
+    second = build(second_service, _rate_sheet())
+    assert second_service.batch_calls == []
+    assert second.is_indexed
+    assert set(second._item_indices) == set(first._item_indices)
+    
+    for name in BATCH_ITEMS:
+        a = first.match_item(name, "Test Hospital", "Radiology", use_llm=False)
+        b = second.match_item(name, "Test Hospital", "Radiology", use_llm=False)
+        _assert_same_matches([a], [b])
+    assert second.match_category("Radiology Services", "Test Hospital").matched_text == "Radiology"
+    
+    # Changed rate sheets are re-embedded
+    changed = _rate_sheet()
+    changed.categories[0].items.append(TieUpItem(item_name="PET Scan", rate=9000))
+    third_service = StubEmbeddingService()
+    build(third_service, changed)
+    assert len(third_service.batch_calls) == 1
+
+
+def test_reindex_reuses_unchanged_item_shards(tmp_path):
+    service = StubEmbeddingService()
+    writer = SemanticMatcher(
+        embedding_service=service, llm_router=StubLLMRouter(), index_cache_dir=str(tmp_path)
+    )
+    assert writer.index_rate_sheets([_rate_sheet()])
+    
+    matcher = _matcher(service)
+    consultation_index = matcher._item_indices[("test hospital", "consultation")]
+    
+    # This one loads the saved (memory-mapped) shards, then re-saves over them
+    reloaded = SemanticMatcher(
+        embedding_service=service, llm_router=StubLLMRouter(), index_cache_dir=str(tmp_path)
+    )
+    assert reloaded.index_rate_sheets([_rate_sheet()])
+    mapped_index = reloaded._item_indices[("test hospital", "consultation")]
+    
+    changed = _rate_sheet()
+    changed.categories[0].items.append(TieUpItem(item_name="PET Scan", rate=9000))
+    for target, kept in ((matcher, consultation_index), (reloaded, mapped_index)):
+        target.clear_indices()
+        service.batch_calls.clear()
+        assert target.index_rate_sheets([changed])
+        
+        # Only the changed Radiology shard's items are embedded again
+        embedded = service.batch_calls[0]
+        assert "PET Scan" in embedded and "CT Brain" in embedded
+        assert "Consultation" in embedded  # category name, always re-embedded
+        assert embedded.count("MRI Brain") == 1
+        assert target._item_indices[("test hospital", "consultation")] is kept
+        assert target._retained_shards == {}
+        
+        # Reused (and re-saved) shards still search correctly
+        match = target.match_item("Consultation", "Test Hospital", "Consultation", use_llm=False)
+        assert match.matched_text == "Consultation"
+        pet = target.match_item("PET Scan", "Test Hospital", "Radiology", use_llm=False)
+        assert pet.matched_text == "PET Scan"
+
+
+def test_exact_fast_path_skips_embedding():
+    service = StubEmbeddingService()
+    matcher = _matcher(service)
+    service.single_calls.clear()
+    
+    match = matcher.match_item("MRI   BRAIN", "Test Hospital", "Radiology", use_llm=False)
+    
+    assert match.matched_text == "MRI Brain"
+    assert match.similarity == 1.0
+    assert match.item.rate == 5000
+    assert service.single_calls == []
+
+
 def main():
     """Run all tests."""
     
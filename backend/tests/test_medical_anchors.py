@@ -0,0 +1,99 @@
+"""Tests for medical anchor extraction and scoring."""
+
+import pytest
+
+from app.verifier.medical_anchors import (
+    calculate_medical_anchor_score,
+    calculate_medical_anchor_score_with_anchors,
+    score_anchor_triples,
+    extract_bodypart,
+    extract_dosage,
+    extract_medical_anchors,
+    extract_modality,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("NICORANDIL 5MG", "5mg"),
+    ("PARACETAMOL 500 MG", "500mg"),
+    ("INSULIN 10ML", "10ml"),
+    ("VITAMIN B12 500µg", "500mcg"),
+    ("SYRUP 5ML 10MG", "10mg"),  # mg takes priority over ml
+    ("CONSULTATION", None),
+    ("MG ML UNITS", None),  # unit words without a number
+])
+def test_extract_dosage(text, expected):
+    assert extract_dosage(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("MRI BRAIN", "mri"),
+    ("CT SCAN ABDOMEN", "ct"),
+    ("X-RAY CHEST", "x-ray"),
+    ("2D ECHOCARDIOGRAPHY", "echocardiography"),
+    ("SPECTRUM TEST", None),  # no partial-word matches
+    ("MRI-BRAIN", "mri"),  # punctuation falls back to the regex scan
+    ("(USG) ABDOMEN", "usg"),
+    ("CONSULTATION", None),
+])
+def test_extract_modality(text, expected):
+    assert extract_modality(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("MRI BRAIN", "brain"),
+    ("CT SCAN ABDOMEN", "abdomen"),
+    ("CARDIAC ECHO", "cardiac"),
+    ("BACKGROUND CHECK", None),
+    ("CT (HEAD)", "head"),
+    ("CONSULTATION", None),
+])
+def test_extract_bodypart(text, expected):
+    assert extract_bodypart(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "MRI BRAIN 5MG",
+    "CT SCAN ABDOMEN",
+    "VITAMIN B12 500µg",
+    "SYRUP 5ML 10MG",
+    "CONSULTATION",
+    "X-RAY CHEST PA VIEW",
+    "MRI-BRAIN (PLAIN)",
+    "USG WHOLE ABDOMEN",
+])
+def test_extract_medical_anchors_matches_individual_extractors(text):
+    assert extract_medical_anchors(text) == (
+        extract_dosage(text),
+        extract_modality(text),
+        extract_bodypart(text),
+    )
+
+
+@pytest.mark.parametrize("bill, tieup, expected", [
+    ("mri brain 5mg", "mri brain 5mg", 1.0),
+    ("mri brain", "mri brain", 0.6),
+    ("nicorandil 5mg", "nicorandil 5mg", 0.4),
+    ("mri brain", "ct brain", 0.3),
+    ("consultation", "consultation", 0.0),
+])
+def test_calculate_medical_anchor_score(bill, tieup, expected):
+    score, breakdown = calculate_medical_anchor_score(bill, tieup)
+    assert score == pytest.approx(expected)
+    assert breakdown["score"] == pytest.approx(expected)
+    assert calculate_medical_anchor_score_with_anchors(
+        bill, extract_medical_anchors(tieup)
+    ) == (score, breakdown)
+    assert score_anchor_triples(
+        extract_medical_anchors(bill), extract_medical_anchors(tieup)
+    ) == (score, breakdown)
+
+
+def test_extract_medical_anchors_is_memoized():
+    extract_medical_anchors.cache_clear()
+    calculate_medical_anchor_score("mri brain", "mri brain 5mg")
+    calculate_medical_anchor_score("ct brain", "mri brain 5mg")
+    
+    info = extract_medical_anchors.cache_info()
+    assert info.misses == 3
+    assert info.hits == 1
@@ -0,0 +1,111 @@
+"""Tests for medical core extraction from noisy bill item strings."""
+
+import pytest
+
+from app.verifier.medical_core_extractor import (
+    extract_drug_name,
+    extract_medical_core,
+    extract_medical_core_batch,
+    extract_strength,
+    is_medical_item,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("PARACETAMOL 500MG STRIP OF 10 LOT:ABC123", "paracetamol 500mg"),
+    ("INSULIN INJECTION 100IU BATCH:XYZ789 EXP:12/2025", "insulin 100iu"),
+    ("1. CONSULTATION - FIRST VISIT | Dr. Vivek", "consultation"),
+    ("MRI BRAIN | Dr. Vivek Jacob Philip", "mri brain"),
+    ("2) CT Scan - Abdomen", "ct scan"),
+    ("SUTURE 3-0 VICRYL LOT:ABC123", "suture 3 0"),
+    ("STENT CORONARY (HS:90183100) BRAND:MEDTRONIC", "stent coronary"),
+    ("ONDANSETRON 4MG BOX OF 5 LOT NO: A77", "ondansetron 4mg"),
+    ("HEPARIN 5000 UNITS MFG:01/02/2024 EXP:DEC-2025", "heparin 5000 units"),
+    ("ROOM RENT - GENERAL WARD -", "room rent"),
+    ("", ""),
+])
+def test_extract_medical_core(text, expected):
+    assert extract_medical_core(text) == expected
+
+
+# "STRIP OF 10" has to go before "\d+ STRIPS?" sees the text; removing
+# both in one leftmost-first alternation used to eat the number instead
+@pytest.mark.parametrize("text, expected", [
+    ("SUTURE 3-0 STRIP OF 10", "suture 3 0"),
+    ("SUTURE VICRYL 2025 STRIP OF 10", "suture vicryl 2025"),
+    ("cbc-2025 strip of 10 100iu", "cbc"),
+])
+def test_inventory_removals_apply_in_pattern_order(text, expected):
+    assert extract_medical_core(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("NICORANDIL 5MG", "5mg"),
+    ("INSULIN 100IU", "100iu"),
+    ("Heparin 5000 units", "5000units"),
+    ("MRI BRAIN", None),
+])
+def test_extract_strength(text, expected):
+    assert extract_strength(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("NICORANDIL 5MG", "nicorandil"),
+    ("PARACETAMOL TABLET 500MG", "paracetamol"),
+    ("MRI BRAIN", "mri brain"),
+])
+def test_extract_drug_name(text, expected):
+    assert extract_drug_name(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("PARACETAMOL 500MG", True),
+    ("x-ray chest", True),
+    ("2) CT Scan - Abdomen", True),
+    ("consultation charges", True),
+    ("ROOM RENT", False),
+])
+def test_is_medical_item(text, expected):
+    assert is_medical_item(text) is expected
+
+
+def test_extract_medical_core_long_ocr_noise_is_fast():
+    # Lazy name groups used to backtrack quadratically on long unmatched lines
+    import time
+    
+    start = time.perf_counter()
+    assert extract_medical_core("AB " * 2000 + "-" * 2000 + "X")
+    assert time.perf_counter() - start < 0.5
+
+
+def test_extract_medical_core_batch_matches_per_item():
+    texts = [
+        "PARACETAMOL 500MG STRIP OF 10 LOT:ABC123",
+        "MRI BRAIN | Dr. Vivek Jacob Philip",
+        "PARACETAMOL 500MG STRIP OF 10 LOT:ABC123",
+        "",
+    ]
+    assert extract_medical_core_batch(texts) == [extract_medical_core(t) for t in texts]
+
+
+def test_extract_medical_core_is_memoized():
+    extract_medical_core.cache_clear()
+    
+    first = extract_medical_core("ONDANSETRON 4MG BOX OF 5 LOT NO: A77")
+    second = extract_medical_core("ONDANSETRON 4MG BOX OF 5 LOT NO: A77")
+    
+    assert first == second == "ondansetron 4mg"
+    info = extract_medical_core.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_unanchored_removal_patterns_require_a_gate_keyword():
+    # Text without any gate keyword skips the unanchored removal passes
+    from app.verifier.medical_core_extractor import (
+        INVENTORY_REMOVAL_PATTERNS,
+        _INVENTORY_KEYWORDS_RE,
+    )
+    
+    for pattern in INVENTORY_REMOVAL_PATTERNS:
+        if not (pattern.startswith('^') or pattern.endswith('$')):
+            assert _INVENTORY_KEYWORDS_RE.search(pattern.upper()), pattern
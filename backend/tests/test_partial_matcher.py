@@ -0,0 +1,81 @@
+"""Tests for token-based partial matching and hybrid scoring."""
+
+import pytest
+
+from app.verifier.partial_matcher import (
+    calculate_containment,
+    calculate_hybrid_score,
+    calculate_token_overlap,
+    extract_core_terms,
+    is_partial_match,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Consultation - First Visit", {"consultation", "first", "visit"}),
+    ("the MRI of brain 2", {"mri", "brain"}),
+    ("X-Ray, Chest (PA)", {"xray", "chest", "pa"}),
+    ("a 10 b", set()),
+    ("", set()),
+])
+def test_extract_core_terms(text, expected):
+    assert extract_core_terms(text) == expected
+
+
+def test_extract_core_terms_is_memoized():
+    extract_core_terms.cache_clear()
+    
+    first = extract_core_terms("ct scan abdomen")
+    second = extract_core_terms("ct scan abdomen")
+    
+    assert first is second
+    assert isinstance(first, frozenset)
+    info = extract_core_terms.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("bill, tieup, overlap, containment", [
+    ("consultation first visit", "consultation", 1 / 3, 1.0),
+    ("ct scan abdomen", "ct scan", 2 / 3, 1.0),
+    ("x ray chest", "chest x ray", 1.0, 1.0),
+    ("ecg test", "electrocardiogram", 0.0, 0.0),
+    ("mri brain", "", 0.0, 0.0),
+])
+def test_overlap_and_containment(bill, tieup, overlap, containment):
+    assert calculate_token_overlap(bill, tieup) == pytest.approx(overlap)
+    assert calculate_containment(bill, tieup) == pytest.approx(containment)
+    
+    score, breakdown = calculate_hybrid_score(bill, tieup, 0.7)
+    assert breakdown["token_overlap"] == pytest.approx(overlap)
+    assert breakdown["containment"] == pytest.approx(containment)
+    assert score == pytest.approx(0.6 * 0.7 + 0.3 * overlap + 0.1 * containment)
+
+
+@pytest.mark.parametrize("bill, tieup, sim, expected_match, expected_reason", [
+    ("x ray chest", "chest x ray", 0.90, True, "high_semantic_similarity"),
+    ("consultation first visit", "consultation", 0.78, True, "hybrid_score=0.67"),
+    ("ct scan abdomen", "ct scan", 0.62, True, "hybrid_score=0.67"),
+    ("ecg test", "electrocardiogram", 0.72, False, "hybrid_score=0.43 (below 0.60)"),
+    ("mri brain", "ct chest", 0.40, False, "low_semantic_similarity"),
+    ("paracetamol 500mg", "paracetamol 500mg", 0.40, True, "identical_text"),
+    ("", "", 0.40, False, "low_semantic_similarity"),
+])
+def test_is_partial_match(bill, tieup, sim, expected_match, expected_reason):
+    is_match, _, reason = is_partial_match(bill, tieup, sim)
+    
+    assert is_match is expected_match
+    assert reason.startswith(expected_reason)
+
+
+def test_is_partial_match_accepts_identical_text_below_semantic_threshold():
+    # Identical text wins over a low embedding score; a one-token difference
+    # at the same score is still rejected by the semantic gate
+    assert is_partial_match("paracetamol 500mg", "paracetamol 500mg", 0.30) == (
+        True, 1.0, "identical_text"
+    )
+    assert is_partial_match(
+        "mri brain", "mri brain", 0.60, min_semantic_similarity=0.70
+    ) == (True, 1.0, "identical_text")
+    assert is_partial_match("paracetamol 500mg", "paracetamol 650mg", 0.30) == (
+        False, 0.30, "low_semantic_similarity"
+    )
@@ -0,0 +1,49 @@
+"""Tests for the Phase-2 aggregation pipeline."""
+
+import app.verifier.phase2_processor as phase2_module
+from app.verifier.models import (
+    CategoryVerificationResult,
+    ItemVerificationResult,
+    VerificationResponse,
+    VerificationStatus,
+)
+
+
+def _green_item(name: str, amount: float) -> ItemVerificationResult:
+    return ItemVerificationResult(
+        bill_item=name.upper(),
+        matched_item=name.title(),
+        status=VerificationStatus.GREEN,
+        bill_amount=amount,
+        allowed_amount=amount,
+        similarity_score=0.97,
+        normalized_item_name=name,
+    )
+
+
+def test_process_phase2_skips_reconciliation_without_mismatches(monkeypatch):
+    def fail_reconcile(**kwargs):
+        raise AssertionError("reconciliation should be skipped")
+    
+    monkeypatch.setattr(phase2_module, "reconcile_categories", fail_reconcile)
+    phase1 = VerificationResponse(
+        hospital="Test Hospital",
+        results=[
+            CategoryVerificationResult(
+                category="Radiology",
+                items=[
+                    _green_item("mri brain", 4000.0),
+                    _green_item("mri brain", 4000.0),
+                    _green_item("ct chest", 2500.0),
+                ],
+            )
+        ],
+    )
+    
+    response = phase2_module.process_phase2(phase1, "Test Hospital")
+    
+    metadata = response.processing_metadata
+    assert metadata["pre_reconciliation_stats"] == {"green": 2, "red": 0, "mismatch": 0}
+    assert metadata["post_reconciliation_stats"] == metadata["pre_reconciliation_stats"]
+    assert metadata["reconciliation_improvement"] == 0
+    assert [item.occurrences for item in response.aggregated_items] == [2, 1]
@@ -0,0 +1,31 @@
+"""Tests for the Phase-3 console formatters."""
+
+from app.verifier.phase3_display import (
+    display_phase3_response,
+    format_consistency_check,
+    format_debug_view,
+    format_final_view,
+)
+from app.verifier.phase3_transformer import transform_to_phase3
+from tests.test_phase3_transformer import _phase2_response
+
+
+def test_display_phase3_response_writes_all_sections_at_once(capsys):
+    response = transform_to_phase3(_phase2_response())
+    
+    display_phase3_response(response)
+    
+    expected = "\n".join([
+        format_debug_view(response.debug_view),
+        format_final_view(response.final_view),
+        format_consistency_check(response.consistency_check),
+    ])
+    assert capsys.readouterr().out == expected + "\n"
+
+
+def test_format_final_view_lists_items_and_totals():
+    text = format_final_view(transform_to_phase3(_phase2_response()).final_view)
+    
+    assert "  1. ✅ MRI Brain | Bill: ₹4000.00 | Allowed: ₹5000.00" in text
+    assert "  2. ⚠️ unknown kit | Bill: ₹250.00" in text
+    assert "  Total Bill: ₹4250.00" in text
@@ -0,0 +1,127 @@
+"""Tests for the Phase-3 dual-view transformer and its view models."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.verifier.models import ItemVerificationResult, VerificationStatus
+from app.verifier.models_v2 import (
+    AggregatedItem,
+    FinancialSummary,
+    GrandTotals,
+    Phase2Response,
+)
+from app.verifier.models_v3 import CandidateMatch
+from app.verifier.phase3_transformer import transform_to_phase3
+
+
+def _phase2_response() -> Phase2Response:
+    green = ItemVerificationResult(
+        bill_item="MRI BRAIN",
+        matched_item="MRI Brain",
+        status=VerificationStatus.GREEN,
+        bill_amount=4000.0,
+        allowed_amount=5000.0,
+        similarity_score=0.97,
+        normalized_item_name="mri brain",
+    )
+    mismatch = ItemVerificationResult(
+        bill_item="UNKNOWN KIT",
+        status=VerificationStatus.MISMATCH,
+        bill_amount=250.0,
+        normalized_item_name="unknown kit",
+    )
+    return Phase2Response(
+        hospital="Test Hospital",
+        phase1_line_items=[green, mismatch],
+        aggregated_items=[
+            AggregatedItem(
+                normalized_name="mri brain",
+                matched_reference="MRI Brain",
+                category="Radiology",
+                occurrences=1,
+                total_bill=4000.0,
+                allowed_per_unit=5000.0,
+                total_allowed=5000.0,
+                total_extra=0.0,
+                status=VerificationStatus.GREEN,
+                line_items=[green],
+            ),
+            AggregatedItem(
+                normalized_name="unknown kit",
+                category="Radiology",
+                occurrences=1,
+                total_bill=250.0,
+                allowed_per_unit=0.0,
+                total_allowed=0.0,
+                total_extra=0.0,
+                status=VerificationStatus.MISMATCH,
+                line_items=[mismatch],
+            ),
+        ],
+        financial_summary=FinancialSummary(
+            grand_totals=GrandTotals(
+                total_bill=4250.0,
+                total_allowed=5000.0,
+                total_extra=0.0,
+                total_allowed_not_comparable=0.0,
+                green_count=1,
+                red_count=0,
+                mismatch_count=1,
+                ignored_count=0,
+            )
+        ),
+    )
+
+
+def test_transform_to_phase3_builds_consistent_views():
+    response = transform_to_phase3(_phase2_response())
+
+    debug_items = response.debug_view.categories[0].items
+    assert [item.original_bill_text for item in debug_items] == ["MRI BRAIN", "UNKNOWN KIT"]
+    assert debug_items[0].matching_strategy == "exact"
+    assert response.debug_view.total_item_count == 2
+    assert response.debug_view.grand_total_bill == pytest.approx(4250.0)
+
+    final_view = response.final_view
+    assert [item.display_name for item in final_view.categories[0].items] == ["MRI Brain", "unknown kit"]
+    assert final_view.grand_total_bill == pytest.approx(4250.0)
+    assert (final_view.green_count, final_view.mismatch_count) == (1, 1)
+    assert response.consistency_check["all_checks_passed"] is True
+    assert response.consistency_check["final_item_count"] == 2
+    assert response.to_json_bytes() == response.model_dump_json().encode()
+
+
+def test_phase3_models_are_frozen_and_strict():
+    candidate = CandidateMatch(
+        candidate_name="MRI Brain", similarity_score=0.9, category="Radiology", was_accepted=True
+    )
+
+    with pytest.raises(ValidationError):
+        candidate.was_accepted = False
+    with pytest.raises(ValidationError):
+        CandidateMatch(
+            candidate_name="MRI Brain",
+            similarity_score=0.9,
+            category="Radiology",
+            was_accepted=True,
+            similarity=0.9,
+        )
+
+
+@pytest.mark.parametrize("matched_item, similarity, expected", [
+    ("MRI Brain", 0.97, "exact"),
+    ("MRI Brain", 0.95, "exact"),
+    ("MRI Brain", 0.90, "fuzzy"),
+    ("MRI Brain", 0.60, "hybrid_v2"),
+    ("MRI Brain", None, "hybrid_v2"),
+    (None, 0.97, "none"),
+])
+def test_matching_strategy_buckets(matched_item, similarity, expected):
+    phase2 = _phase2_response()
+    line_item = phase2.aggregated_items[0].line_items[0]
+    line_item.matched_item = matched_item
+    line_item.similarity_score = similarity
+    
+    response = transform_to_phase3(phase2)
+    
+    assert response.debug_view.categories[0].items[0].matching_strategy == expected
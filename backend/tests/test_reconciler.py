@@ -0,0 +1,105 @@
+"""Tests for alternative-category reconciliation of MISMATCH items."""
+
+from types import SimpleNamespace
+
+import app.verifier.reconciler as reconciler_module
+from app.verifier.models import VerificationStatus
+from app.verifier.models_v2 import AggregatedItem
+
+
+class _FakeMatcher:
+    """Matcher stub returning fixed similarities per category."""
+    
+    def __init__(self, categories, similarities):
+        self.categories = categories
+        self.similarities = similarities
+        self.calls = []
+    
+    def match_hospital(self, hospital_name):
+        rate_sheet = SimpleNamespace(
+            categories=[SimpleNamespace(category_name=name) for name in self.categories]
+        )
+        return SimpleNamespace(is_match=True, rate_sheet=rate_sheet)
+    
+    def match_item(self, item_name, hospital_name, category_name, threshold):
+        self.calls.append(category_name)
+        similarity = self.similarities.get(category_name, 0.0)
+        return SimpleNamespace(
+            is_match=similarity >= threshold,
+            similarity=similarity,
+            matched_text=f"{item_name} ({category_name})",
+        )
+
+
+def _mismatch_item() -> AggregatedItem:
+    return AggregatedItem(
+        normalized_name="cross consultation",
+        category="consultation",
+        occurrences=1,
+        total_bill=800.0,
+        allowed_per_unit=0.0,
+        total_allowed=0.0,
+        total_extra=0.0,
+        status=VerificationStatus.MISMATCH,
+    )
+
+
+def test_try_alternative_categories_keeps_categories_up_to_best(monkeypatch):
+    matcher = _FakeMatcher(
+        categories=["consultation", "radiology", "specialist", "pharmacy", "lab"],
+        similarities={"radiology": 0.90, "specialist": 0.97, "lab": 0.91},
+    )
+    monkeypatch.setattr(reconciler_module, "get_matcher", lambda: matcher)
+    
+    best_match = reconciler_module.try_alternative_categories(
+        _mismatch_item(), "Test Hospital", {}
+    )
+    
+    assert matcher.calls == ["radiology", "specialist", "pharmacy", "lab"]
+    assert best_match["category"] == "specialist"
+    assert best_match["similarity"] == 0.97
+    assert best_match["attempted_categories"] == ["consultation", "radiology", "specialist"]
+
+
+def test_try_alternative_categories_without_match(monkeypatch):
+    matcher = _FakeMatcher(categories=["consultation", "radiology"], similarities={})
+    monkeypatch.setattr(reconciler_module, "get_matcher", lambda: matcher)
+    
+    assert reconciler_module.try_alternative_categories(
+        _mismatch_item(), "Test Hospital", {}
+    ) is None
+
+
+def test_try_alternative_categories_stops_at_near_perfect_match(monkeypatch):
+    matcher = _FakeMatcher(
+        categories=["consultation", "radiology", "specialist", "lab"],
+        similarities={"radiology": 0.90, "specialist": 0.99, "lab": 1.0},
+    )
+    monkeypatch.setattr(reconciler_module, "get_matcher", lambda: matcher)
+    
+    best_match = reconciler_module.try_alternative_categories(
+        _mismatch_item(), "Test Hospital", {}
+    )
+    
+    assert matcher.calls == ["radiology", "specialist"]
+    assert best_match["category"] == "specialist"
+    assert best_match["attempted_categories"] == ["consultation", "radiology", "specialist"]
+
+
+def test_reconcile_categories_looks_up_hospital_once(monkeypatch):
+    matcher = _FakeMatcher(
+        categories=["consultation", "specialist"],
+        similarities={"specialist": 0.90},
+    )
+    hospital_lookups = []
+    match_hospital = matcher.match_hospital
+    matcher.match_hospital = lambda name: hospital_lookups.append(name) or match_hospital(name)
+    monkeypatch.setattr(reconciler_module, "get_matcher", lambda: matcher)
+    
+    reconciled = reconciler_module.reconcile_categories(
+        [_mismatch_item(), _mismatch_item(), _mismatch_item()], "Test Hospital", {}
+    )
+    
+    assert hospital_lookups == ["Test Hospital"]
+    assert [item.category for item in reconciled] == ["specialist"] * 3
+    assert all(item.status == VerificationStatus.GREEN for item in reconciled)
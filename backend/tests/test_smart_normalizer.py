@@ -0,0 +1,65 @@
+"""Tests for weighted token classification."""
+
+import pytest
+
+from app.verifier.smart_normalizer import (
+    TokenImportance,
+    classify_token_importance,
+    normalize_with_weights,
+    tokenize_with_weights,
+)
+
+
+@pytest.mark.parametrize("token, expected", [
+    ("consultation", TokenImportance.CRITICAL),  # also a MEDIUM term
+    ("FIRST", TokenImportance.HIGH),
+    ("500mg", TokenImportance.HIGH),
+    ("visit", TokenImportance.MEDIUM),
+    ("strip", TokenImportance.LOW),
+    ("LOT:A12", TokenImportance.NOISE),
+    ("batch-7", TokenImportance.NOISE),
+    ("(30049099)", TokenImportance.NOISE),
+    ("|GTF", TokenImportance.NOISE),
+    ("blood", TokenImportance.CRITICAL),
+    ("2.5ML", TokenImportance.HIGH),
+    ("nicorandil", TokenImportance.CRITICAL),
+    ("ab", TokenImportance.MEDIUM),
+])
+def test_classify_token_importance(token, expected):
+    assert classify_token_importance(token, 0, token) == expected
+
+
+def test_tokenize_with_weights():
+    tokens = tokenize_with_weights("CONSULTATION - FIRST VISIT | Dr. Vivek")
+    
+    assert [(t.text, t.importance) for t in tokens] == [
+        ("consultation", TokenImportance.CRITICAL),
+        ("first", TokenImportance.HIGH),
+        ("visit", TokenImportance.MEDIUM),
+        ("dr", TokenImportance.MEDIUM),
+        ("vivek", TokenImportance.CRITICAL),
+    ]
+
+
+def test_tokenize_with_weights_positions_count_skipped_tokens():
+    tokens = tokenize_with_weights("X-RAY, a CHEST/PA view")
+    
+    assert [(t.text, t.original_position) for t in tokens] == [
+        ("x-ray", 0),
+        ("chest", 2),
+        ("pa", 3),
+        ("view", 4),
+    ]
+
+
+def test_normalize_with_weights_filters_by_min_importance():
+    text, tokens = normalize_with_weights(
+        "CONSULTATION - FIRST VISIT | Dr. Vivek", min_importance=TokenImportance.HIGH
+    )
+    
+    assert text == "consultation first vivek"
+    assert [t.importance for t in tokens] == [
+        TokenImportance.CRITICAL,
+        TokenImportance.HIGH,
+        TokenImportance.CRITICAL,
+    ]
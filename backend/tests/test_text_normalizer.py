@@ -0,0 +1,58 @@
+"""Tests for bill item and category text normalization."""
+
+import pytest
+
+from app.verifier.text_normalizer import (
+    is_administrative_charge,
+    is_non_medical_artifact,
+    normalize_bill_item_text,
+    normalize_category_name,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1. CONSULTATION - FIRST VISIT | Dr. Vivek JaCob P", "consultation - first visit"),
+    ("MRI BRAIN | Dr. Vivek Jacob Philip", "mri brain"),
+    ("2) CT Scan - Abdomen", "ct scan - abdomen"),
+    ("1. a) X-Ray Chest", "x-ray chest"),
+    ("CONSULTATION - Dr. Rao MD", "consultation"),
+    ("ECG TEST -", "ecg test"),
+    ("ROOM RENT:", "room rent"),
+    ("MRI BRAIN", "mri brain"),
+    ("", ""),
+])
+def test_normalize_bill_item_text(text, expected):
+    assert normalize_bill_item_text(text) == expected
+
+
+def test_normalize_bill_item_text_is_memoized():
+    normalize_bill_item_text.cache_clear()
+    
+    assert normalize_bill_item_text("SYRINGE 5ML | Ward 3") == "syringe 5ml"
+    assert normalize_bill_item_text("SYRINGE 5ML | Ward 3") == "syringe 5ml"
+    
+    info = normalize_bill_item_text.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_normalize_category_name():
+    assert normalize_category_name("  3. Radiology   Services ") == "radiology services"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("123456789", True),
+    ("LOT:ABC123", True),
+    ("EXP:12/11/2025", True),
+    ("PARACETAMOL 500MG", False),
+])
+def test_is_non_medical_artifact(text, expected):
+    assert is_non_medical_artifact(text) is expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Registration Fee", True),
+    ("Admission Charges", True),
+    ("Consultation", False),
+])
+def test_is_administrative_charge(text, expected):
+    assert is_administrative_charge(text) is expected